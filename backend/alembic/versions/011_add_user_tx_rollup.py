@@ -0,0 +1,66 @@
+"""Add user_tx_rollup table for O(1) budget stats.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-08-28
+
+Changes:
+- Add user_tx_rollup table with per-user running totals and date bounds
+- Backfill from existing transactions
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_tx_rollup",
+        sa.Column(
+            "user_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("first_date", sa.Date(), nullable=True),
+        sa.Column("last_date", sa.Date(), nullable=True),
+        sa.Column("total_expenses", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("total_income", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("weekly_total", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("large_total", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+    )
+
+    # Backfill from existing transactions
+    op.execute(
+        """
+        INSERT INTO user_tx_rollup
+            (user_id, first_date, last_date, total_expenses, total_income, weekly_total, large_total)
+        SELECT
+            user_id,
+            MIN(date),
+            MAX(date),
+            COALESCE(SUM(ABS(amount_signed)) FILTER (WHERE NOT is_income), 0),
+            COALESCE(SUM(amount_signed) FILTER (WHERE is_income), 0),
+            COALESCE(SUM(ABS(amount_signed)) FILTER (WHERE NOT is_income AND is_weekly), 0),
+            COALESCE(SUM(ABS(amount_signed)) FILTER (WHERE NOT is_income AND NOT is_weekly), 0)
+        FROM transactions
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_tx_rollup")
@@ -0,0 +1,35 @@
+"""Add generated amount_cents column to transactions.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-08-28
+
+Changes:
+- Add amount_cents BIGINT generated column (amount_signed * 100) so the
+  aggregate endpoints can sum int8 instead of numeric
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "amount_cents",
+            sa.BigInteger(),
+            sa.Computed("(amount_signed * 100)::bigint", persisted=True),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("transactions", "amount_cents")
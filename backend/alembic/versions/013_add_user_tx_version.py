@@ -0,0 +1,30 @@
+"""Add tx_version counter to users.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-08-28
+
+Changes:
+- Add users.tx_version BIGINT, bumped on every transaction write, used to
+  derive ETags for the /transactions stats endpoints
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("tx_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "tx_version")
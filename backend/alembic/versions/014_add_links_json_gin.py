@@ -0,0 +1,32 @@
+"""Add jsonb_path_ops GIN index on classes.links_json.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-08-28
+
+Changes:
+- GIN (jsonb_path_ops) index so @> containment filters on class links
+  use an index scan instead of a seq scan
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_classes_links_json_gin",
+        "classes",
+        ["links_json"],
+        postgresql_using="gin",
+        postgresql_ops={"links_json": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_classes_links_json_gin", table_name="classes")
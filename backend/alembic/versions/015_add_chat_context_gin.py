@@ -0,0 +1,36 @@
+"""Add GIN indexes on chat_conversations context arrays.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-08-28
+
+Changes:
+- GIN indexes on the four context_*_ids UUID arrays so containment
+  lookups (which conversations reference class/assignment/pdf/note X)
+  use index scans
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    ("idx_chat_conv_ctx_class_gin", "context_class_ids"),
+    ("idx_chat_conv_ctx_assignment_gin", "context_assignment_ids"),
+    ("idx_chat_conv_ctx_pdf_gin", "context_pdf_ids"),
+    ("idx_chat_conv_ctx_note_gin", "context_note_ids"),
+]
+
+
+def upgrade() -> None:
+    for name, column in _INDEXES:
+        op.create_index(name, "chat_conversations", [column], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    for name, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name="chat_conversations")
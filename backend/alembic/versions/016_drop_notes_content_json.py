@@ -0,0 +1,28 @@
+"""Drop deprecated notes.content_json column.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-08-28
+
+Changes:
+- Drop notes.content_json (unused since markdown moved to content_text);
+  removes TOAST overhead on every note row fetch
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_column("notes", "content_json")
+
+
+def downgrade() -> None:
+    op.add_column("notes", sa.Column("content_json", JSONB, nullable=True))
@@ -0,0 +1,42 @@
+"""Add partial index for active assignments and BRIN on transactions.date.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-08-28
+
+Changes:
+- Partial (user_id, due_date) index on unfinished assignments; drops the
+  full (user_id, status) composite it replaces
+- BRIN index on transactions.date for append-mostly date-range scans
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "017"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_assignments_user_active",
+        "assignments",
+        ["user_id", "due_date"],
+        postgresql_where=sa.text("status <> 'finished'"),
+    )
+    op.drop_index("idx_assignments_user_status", table_name="assignments")
+    op.create_index(
+        "idx_transactions_date_brin",
+        "transactions",
+        ["date"],
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_transactions_date_brin", table_name="transactions")
+    op.create_index("idx_assignments_user_status", "assignments", ["user_id", "status"])
+    op.drop_index("idx_assignments_user_active", table_name="assignments")
@@ -0,0 +1,50 @@
+"""Convert users.email from CITEXT to varchar with lower() unique index.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-08-28
+
+Changes:
+- users.email CITEXT -> VARCHAR(255)
+- Replace the plain unique constraint/index with a unique expression
+  index on lower(email); the app lowercases emails before writing
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import CITEXT
+
+# revision identifiers, used by Alembic.
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_users_email", table_name="users")
+    op.drop_constraint("users_email_key", "users", type_="unique")
+    op.alter_column(
+        "users",
+        "email",
+        type_=sa.String(255),
+        postgresql_using="email::varchar(255)",
+    )
+    op.create_index(
+        "idx_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_users_email_lower", table_name="users")
+    op.alter_column(
+        "users",
+        "email",
+        type_=CITEXT(),
+        postgresql_using="email::citext",
+    )
+    op.create_unique_constraint("users_email_key", "users", ["email"])
+    op.create_index("idx_users_email", "users", ["email"])
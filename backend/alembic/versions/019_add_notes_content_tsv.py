@@ -0,0 +1,46 @@
+"""Add generated tsvector column + GIN index for note search.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-08-28
+
+Changes:
+- notes.content_tsv: stored generated to_tsvector over title + content_text
+- GIN index so the list endpoint's q filter is an index scan
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# revision identifiers, used by Alembic.
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notes",
+        sa.Column(
+            "content_tsv",
+            TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', coalesce(title,'') || ' ' || coalesce(content_text,''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_notes_content_tsv_gin",
+        "notes",
+        ["content_tsv"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_notes_content_tsv_gin", table_name="notes")
+    op.drop_column("notes", "content_tsv")
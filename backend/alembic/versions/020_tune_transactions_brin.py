@@ -0,0 +1,39 @@
+"""Rebuild transactions date BRIN with smaller pages_per_range.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-08-28
+
+Changes:
+- idx_transactions_date_brin rebuilt with pages_per_range=32 (default is
+  128) for more selective block ranges on a modest-sized table
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_transactions_date_brin", table_name="transactions")
+    op.create_index(
+        "idx_transactions_date_brin",
+        "transactions",
+        ["date"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_transactions_date_brin", table_name="transactions")
+    op.create_index(
+        "idx_transactions_date_brin",
+        "transactions",
+        ["date"],
+        postgresql_using="brin",
+    )
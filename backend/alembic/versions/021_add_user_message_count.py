@@ -0,0 +1,49 @@
+"""Add running user_message_count to chat_conversations.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-08-28
+
+Changes:
+- chat_conversations.user_message_count, backfilled from existing
+  messages, so the brain-update trigger reads a counter instead of
+  re-counting the conversation history each turn
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chat_conversations",
+        sa.Column(
+            "user_message_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE chat_conversations c
+        SET user_message_count = sub.cnt
+        FROM (
+            SELECT conversation_id, COUNT(*) AS cnt
+            FROM chat_messages
+            WHERE role = 'user'
+            GROUP BY conversation_id
+        ) sub
+        WHERE sub.conversation_id = c.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("chat_conversations", "user_message_count")
@@ -0,0 +1,38 @@
+"""Make classes.links_json NOT NULL with '{}' default.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-08-28
+
+Changes:
+- Coalesce existing NULL links_json values to '{}' and add NOT NULL, so
+  the schema layer no longer needs a per-instance coalescing validator
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE classes SET links_json = '{}'::jsonb WHERE links_json IS NULL")
+    op.alter_column(
+        "classes",
+        "links_json",
+        nullable=False,
+        server_default=sa.text("'{}'::jsonb"),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "classes",
+        "links_json",
+        nullable=True,
+        server_default=sa.text("'{}'::jsonb"),
+    )
@@ -0,0 +1,41 @@
+"""Add rolling history summary to chat_conversations.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-08-28
+
+Changes:
+- chat_conversations.history_summary / history_summary_count: messages
+  older than the verbatim chat window are folded into a stored summary
+  so per-turn LLM input stays bounded on long conversations
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chat_conversations",
+        sa.Column("history_summary", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "chat_conversations",
+        sa.Column(
+            "history_summary_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("chat_conversations", "history_summary_count")
+    op.drop_column("chat_conversations", "history_summary")
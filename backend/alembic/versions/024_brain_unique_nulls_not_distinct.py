@@ -0,0 +1,54 @@
+"""Make the brain uniqueness constraint treat NULL class_id as equal.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-08-28
+
+Changes:
+- unique_user_class_brain rebuilt with NULLS NOT DISTINCT, so global
+  brains (class_id NULL) conflict like any other row and brain creation
+  can use an atomic INSERT ... ON CONFLICT upsert
+- duplicate global brains that slipped through the old constraint are
+  collapsed first, keeping the most recently updated row
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM brain_memories b
+        USING brain_memories keep
+        WHERE b.user_id = keep.user_id
+          AND b.brain_type = keep.brain_type
+          AND b.class_id IS NULL
+          AND keep.class_id IS NULL
+          AND b.id <> keep.id
+          AND (b.updated_at, b.id) < (keep.updated_at, keep.id)
+        """
+    )
+    op.drop_constraint("unique_user_class_brain", "brain_memories", type_="unique")
+    op.execute(
+        """
+        ALTER TABLE brain_memories
+        ADD CONSTRAINT unique_user_class_brain
+        UNIQUE NULLS NOT DISTINCT (user_id, class_id, brain_type)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("unique_user_class_brain", "brain_memories", type_="unique")
+    op.create_unique_constraint(
+        "unique_user_class_brain",
+        "brain_memories",
+        ["user_id", "class_id", "brain_type"],
+    )
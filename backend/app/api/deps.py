@@ -214,6 +214,7 @@ async def get_user_resource_or_404(
     model: type,
     resource_id: UUID,
     user_id: UUID,
+    *options,
 ):
     """
     Generic helper to fetch a user-owned resource by ID.
@@ -223,11 +224,15 @@ async def get_user_resource_or_404(
             db, Assignment, assignment_id, current_user.id
         )
 
+    Extra loader options (e.g. undefer() for deferred columns) can be
+    passed positionally after user_id.
+
     This enforces user scoping at the SQL level (WHERE user_id = ...).
     """
-    result = await db.execute(
-        select(model).where(model.id == resource_id, model.user_id == user_id)
-    )
+    query = select(model).where(model.id == resource_id, model.user_id == user_id)
+    if options:
+        query = query.options(*options)
+    result = await db.execute(query)
     resource = result.scalar_one_or_none()
 
     if resource is None:
@@ -60,7 +60,6 @@ async def create_assignment(
     )
     db.add(new_assignment)
     await db.commit()
-    await db.refresh(new_assignment)
     return AssignmentRead.model_validate(new_assignment)
 
 
@@ -87,7 +86,6 @@ async def update_assignment(
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(assignment, key, value)
     await db.commit()
-    await db.refresh(assignment)
     return AssignmentRead.model_validate(assignment)
 
 
@@ -26,9 +26,9 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token as google_id_token
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.config import get_settings
 from app.db.models import AuthIdentity, User
@@ -40,6 +40,9 @@ from app.api.deps import create_access_token, CurrentUser
 router = APIRouter(prefix="/auth", tags=["auth"])
 settings = get_settings()
 
+# Accepted issuers for Google id_tokens (checked on every login)
+_GOOGLE_ISSUERS = frozenset({"accounts.google.com", "https://accounts.google.com"})
+
 
 @router.post("/google", response_model=TokenResponse)
 async def google_login(
@@ -74,7 +77,7 @@ async def google_login(
         name = idinfo.get("name", email or "Unknown User")
 
         # Additional verification
-        if idinfo.get("iss") not in ["accounts.google.com", "https://accounts.google.com"]:
+        if idinfo.get("iss") not in _GOOGLE_ISSUERS:
             raise ValueError("Invalid issuer")
 
         # Security: Only trust verified emails
@@ -88,10 +91,11 @@ async def google_login(
             detail=f"Invalid Google id_token: {e}",
         )
 
-    # Look up existing auth_identity (eagerly load user to avoid async lazy-load)
+    # Look up existing auth_identity (eagerly load user to avoid async lazy-load;
+    # many-to-one, so a joinedload folds it into the same SELECT)
     result = await db.execute(
         select(AuthIdentity)
-        .options(selectinload(AuthIdentity.user))
+        .options(joinedload(AuthIdentity.user))
         .where(
             AuthIdentity.provider == "google",
             AuthIdentity.provider_user_id == provider_user_id,
@@ -109,7 +113,10 @@ async def google_login(
         # New user - check if email exists (link accounts)
         user = None
         if email:
-            result = await db.execute(select(User).where(User.email == email.lower()))
+            # lower() on both sides so the lookup hits idx_users_email_lower
+            result = await db.execute(
+                select(User).where(func.lower(User.email) == email.lower())
+            )
             user = result.scalar_one_or_none()
 
         if user is None:
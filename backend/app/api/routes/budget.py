@@ -27,7 +27,6 @@ async def get_budget_settings(
         settings = BudgetSettings(user_id=current_user.id)
         db.add(settings)
         await db.commit()
-        await db.refresh(settings)
     
     return BudgetSettingsRead.model_validate(settings)
 
@@ -56,5 +55,4 @@ async def update_budget_settings(
             setattr(settings, key, value)
     
     await db.commit()
-    await db.refresh(settings)
     return BudgetSettingsRead.model_validate(settings)
@@ -1,10 +1,11 @@
 """API routes for chat conversations with streaming support."""
 
-import asyncio
 import logging
+from functools import partial
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy import select, func
 from sse_starlette.sse import EventSourceResponse
 
@@ -30,10 +31,16 @@ from app.schemas.chat import (
 )
 from app.config import sanitize_error
 from app.db.session import AsyncSessionLocal
-from app.services import chat_service, brain_manager
+from app.services import background, chat_service, brain_manager
 
 logger = logging.getLogger(__name__)
 
+# Serialize the list/detail payloads straight to JSON bytes in
+# pydantic-core, skipping FastAPI's validate -> dict -> re-encode
+# round-trip
+_CONV_LIST_ADAPTER = TypeAdapter(ConversationListResponse)
+_CONV_WITH_MESSAGES_ADAPTER = TypeAdapter(ConversationWithMessages)
+
 
 async def _update_brains_background(
     user_id: UUID,
@@ -44,7 +51,8 @@ async def _update_brains_background(
     """
     Update brains in the background using a fresh database session.
 
-    This runs as an asyncio task so it doesn't block the SSE stream completion.
+    This runs on the background worker queue so it doesn't block the SSE
+    stream completion.
     """
     try:
         async with AsyncSessionLocal() as db:
@@ -215,10 +223,14 @@ async def list_conversations(
     result = await db.execute(stmt)
     conversations = result.scalars().all()
 
-    return ConversationListResponse(
+    payload = ConversationListResponse(
         conversations=[ConversationResponse.model_validate(c) for c in conversations],
         total=total,
     )
+    return Response(
+        content=_CONV_LIST_ADAPTER.dump_json(payload),
+        media_type="application/json",
+    )
 
 
 @router.get("/conversations/{conversation_id}", response_model=ConversationWithMessages)
@@ -242,11 +254,16 @@ async def get_conversation(
     result = await db.execute(stmt)
     messages = result.scalars().all()
 
-    # Build response
-    return ConversationWithMessages(
+    # Build response; serialize once in pydantic-core rather than per
+    # message through the response_model pipeline
+    payload = ConversationWithMessages(
         **ConversationResponse.model_validate(conversation).model_dump(),
         messages=[ChatMessageResponse.model_validate(m) for m in messages],
     )
+    return Response(
+        content=_CONV_WITH_MESSAGES_ADAPTER.dump_json(payload),
+        media_type="application/json",
+    )
 
 
 @router.patch("/conversations/{conversation_id}", response_model=ConversationResponse)
@@ -353,13 +370,24 @@ async def stream_chat_message(
 
     history = [{"role": msg.role, "content": msg.content} for msg in messages]
 
-    # Save user message
+    # Bound per-turn input: swap summarized turns for the stored rolling
+    # summary, and refresh it in the background once enough messages have
+    # aged past the window (the refreshed summary applies from next turn)
+    if chat_service.history_summary_due(conversation, len(history)):
+        background.submit(
+            partial(chat_service.refresh_history_summary, conversation.id)
+        )
+    history = chat_service.apply_history_window(conversation, history)
+
+    # Save user message (and bump the running counter the brain-update
+    # trigger reads, instead of re-counting the history later)
     user_message = ChatMessage(
         conversation_id=conversation_id,
         role="user",
         content=request.message,
     )
     db.add(user_message)
+    conversation.user_message_count += 1
     await db.commit()
 
     async def event_generator():
@@ -394,12 +422,16 @@ async def stream_chat_message(
                 {"role": "assistant", "content": full_response},
             ]
 
-            # Check if we should update brains (fire as background task)
-            should_update = await brain_manager.detect_pattern_update(updated_history)
+            # Check if we should update brains (queued for the background
+            # worker - keeps a strong reference, unlike bare create_task)
+            should_update = await brain_manager.detect_pattern_update(
+                full_response, conversation.user_message_count
+            )
 
             if should_update:
-                asyncio.create_task(
-                    _update_brains_background(
+                background.submit(
+                    partial(
+                        _update_brains_background,
                         user_id=user.id,
                         conversation_id=conversation.id,
                         context_class_ids=list(conversation.context_class_ids),
@@ -41,7 +41,6 @@ async def create_class(
     )
     db.add(new_class)
     await db.commit()
-    await db.refresh(new_class)
     return ClassRead.model_validate(new_class)
 
 
@@ -68,7 +67,6 @@ async def update_class(
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(cls, key, value)
     await db.commit()
-    await db.refresh(cls)
     return ClassRead.model_validate(cls)
 
 
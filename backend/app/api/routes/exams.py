@@ -53,7 +53,6 @@ async def create_exam(
     )
     db.add(new_exam)
     await db.commit()
-    await db.refresh(new_exam)
     return ExamRead.model_validate(new_exam)
 
 
@@ -80,7 +79,6 @@ async def update_exam(
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(exam, key, value)
     await db.commit()
-    await db.refresh(exam)
     return ExamRead.model_validate(exam)
 
 
@@ -3,8 +3,8 @@
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import or_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
 
 from app.api.deps import CurrentUser, DbSession, get_user_resource_or_404
 from app.db.models import Assignment, Class, Note
@@ -53,7 +53,7 @@ async def list_notes(
     query = (
         select(Note)
         .where(Note.user_id == current_user.id)
-        .options(selectinload(Note.class_), selectinload(Note.assignment))
+        .options(joinedload(Note.class_), joinedload(Note.assignment))
     )
     
     if class_id:
@@ -64,13 +64,10 @@ async def list_notes(
         # Use PostgreSQL array containment operator
         query = query.where(Note.tags.contains([tag]))
     if q:
-        # Search in title and content_text (case-insensitive)
-        search_pattern = f"%{q}%"
+        # Full-text search over title + content via the generated tsvector
+        # (GIN index scan; replaces ILIKE '%...%' seq scans)
         query = query.where(
-            or_(
-                Note.title.ilike(search_pattern),
-                Note.content_text.ilike(search_pattern),
-            )
+            Note.content_tsv.op("@@")(func.websearch_to_tsquery("english", q))
         )
     if standalone:
         query = query.where(Note.class_id.is_(None), Note.assignment_id.is_(None))
@@ -131,7 +128,7 @@ async def create_note(
     result = await db.execute(
         select(Note)
         .where(Note.id == new_note.id)
-        .options(selectinload(Note.class_), selectinload(Note.assignment))
+        .options(joinedload(Note.class_), joinedload(Note.assignment))
     )
     new_note = result.scalar_one()
     return note_to_read(new_note)
@@ -147,7 +144,7 @@ async def get_note(
     result = await db.execute(
         select(Note)
         .where(Note.id == note_id, Note.user_id == current_user.id)
-        .options(selectinload(Note.class_), selectinload(Note.assignment))
+        .options(joinedload(Note.class_), joinedload(Note.assignment))
     )
     note = result.scalar_one_or_none()
     if not note:
@@ -175,7 +172,7 @@ async def update_note(
     result = await db.execute(
         select(Note)
         .where(Note.id == note_id)
-        .options(selectinload(Note.class_), selectinload(Note.assignment))
+        .options(joinedload(Note.class_), joinedload(Note.assignment))
     )
     note = result.scalar_one()
     return note_to_read(note)
@@ -3,8 +3,10 @@
 import logging
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy import select, func
+from sqlalchemy.orm import undefer
 
 from app.api.deps import CurrentUser, DbSession, get_user_resource_or_404
 from app.config import sanitize_error
@@ -23,6 +25,10 @@ from app.services import s3_service, pdf_processor
 
 router = APIRouter(prefix="/pdfs", tags=["pdfs"])
 
+# Serializes the list payload straight to JSON bytes in pydantic-core,
+# skipping FastAPI's validate -> dict -> re-encode round-trip
+_PDF_LIST_ADAPTER = TypeAdapter(PDFListResponse)
+
 
 # =============================================================================
 # PDF UPLOAD
@@ -65,7 +71,6 @@ async def get_upload_url(
     )
     db.add(pdf)
     await db.commit()
-    await db.refresh(pdf)
 
     return PDFUploadURLResponse(
         upload_url=presigned["url"],
@@ -86,8 +91,11 @@ async def process_pdf(
     Call this after successfully uploading file to S3 using presigned URL.
     This downloads the PDF from S3, extracts text, and updates the database.
     """
-    # Get PDF record (with ownership check)
-    pdf = await get_user_resource_or_404(db, PDF, pdf_id, user.id)
+    # Get PDF record (with ownership check); undefer the text so the
+    # already-processed branch can report its length
+    pdf = await get_user_resource_or_404(
+        db, PDF, pdf_id, user.id, undefer(PDF.extracted_text)
+    )
 
     # Check if already processed
     if pdf.extraction_status == "success":
@@ -138,7 +146,6 @@ async def process_pdf(
         pdf.extraction_status = result["status"]
 
         await db.commit()
-        await db.refresh(pdf)
 
         logger.info(
             "PDF processed successfully: %s (%d pages, %d chars)",
@@ -217,10 +224,14 @@ async def list_pdfs(
     result = await db.execute(query)
     pdfs = result.scalars().all()
 
-    return PDFListResponse(
+    payload = PDFListResponse(
         pdfs=[PDFResponse.model_validate(pdf) for pdf in pdfs],
         total=total,
     )
+    return Response(
+        content=_PDF_LIST_ADAPTER.dump_json(payload),
+        media_type="application/json",
+    )
 
 
 @router.get("/{pdf_id}", response_model=PDFWithText)
@@ -230,7 +241,9 @@ async def get_pdf(
     user: CurrentUser,
 ):
     """Get PDF details including extracted text."""
-    pdf = await get_user_resource_or_404(db, PDF, pdf_id, user.id)
+    pdf = await get_user_resource_or_404(
+        db, PDF, pdf_id, user.id, undefer(PDF.extracted_text)
+    )
     return PDFWithText.model_validate(pdf)
 
 
@@ -56,7 +56,6 @@ async def create_time_block(
     )
     db.add(new_block)
     await db.commit()
-    await db.refresh(new_block)
     return TimeBlockRead.model_validate(new_block)
 
 
@@ -83,7 +82,6 @@ async def update_time_block(
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(block, key, value)
     await db.commit()
-    await db.refresh(block)
     return TimeBlockRead.model_validate(block)
 
 
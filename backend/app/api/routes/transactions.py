@@ -2,13 +2,17 @@
 
 from datetime import date, timedelta
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, status
-from sqlalchemy import func, select, and_, case
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, func, select, and_, case, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, DbSession, get_user_resource_or_404
-from app.db.models import Transaction, BudgetSettings
+from app.db.models import Transaction, BudgetSettings, User, UserTxRollup
 from app.schemas.transactions import TransactionCreate, TransactionRead, TransactionUpdate
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
@@ -19,6 +23,214 @@ def _monday_of(d: date) -> date:
     return d - timedelta(days=d.weekday())
 
 
+# =============================================================================
+# PRECOMPILED AGGREGATE STATEMENTS
+# =============================================================================
+# The aggregate endpoints return plain scalar rows and gain nothing from the
+# ORM's identity map or unit of work. Module-level text() statements are
+# compiled once and go straight through asyncpg's row decoding.
+
+# Sums run over the generated amount_cents column: int8 aggregation is far
+# cheaper than numeric and the driver returns int, not Decimal. Cents are
+# divided back to dollars once per value in Python.
+
+_SUMMARY_SQL = text(
+    """
+    SELECT
+        COALESCE(SUM(amount_cents) FILTER (WHERE is_income), 0) AS income_cents,
+        COALESCE(SUM(amount_cents) FILTER (WHERE NOT is_income), 0) AS expense_cents,
+        COALESCE(SUM(amount_cents), 0) AS net_cents
+    FROM transactions
+    WHERE user_id = :uid
+      AND (CAST(:date_from AS date) IS NULL OR date >= :date_from)
+      AND (CAST(:date_to AS date) IS NULL OR date <= :date_to)
+    """
+)
+
+_TREND_SQL = text(
+    """
+    SELECT
+        date,
+        COALESCE(SUM(ABS(amount_cents)) FILTER (WHERE NOT is_income), 0) AS expense_cents,
+        COALESCE(SUM(amount_cents) FILTER (WHERE is_income), 0) AS income_cents
+    FROM transactions
+    WHERE user_id = :uid AND date >= :date_from AND date <= :date_to
+    GROUP BY date
+    ORDER BY date
+    """
+)
+
+
+# =============================================================================
+# ROLLUP MAINTENANCE
+# =============================================================================
+
+
+async def _rollup_add(
+    db: AsyncSession,
+    user_id: UUID,
+    txn_date: date,
+    amount_signed: Decimal,
+    is_income: bool,
+    is_weekly: bool,
+) -> None:
+    """
+    Incrementally fold one new transaction into the user's rollup row.
+
+    Runs in the same transaction as the insert, so the rollup can never
+    drift from the transactions table.
+    """
+    expense = abs(amount_signed) if not is_income else Decimal("0")
+    income = amount_signed if is_income else Decimal("0")
+    weekly = expense if is_weekly else Decimal("0")
+    large = expense - weekly
+
+    stmt = pg_insert(UserTxRollup).values(
+        user_id=user_id,
+        first_date=txn_date,
+        last_date=txn_date,
+        total_expenses=expense,
+        total_income=income,
+        weekly_total=weekly,
+        large_total=large,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserTxRollup.user_id],
+        set_={
+            "first_date": func.least(UserTxRollup.first_date, txn_date),
+            "last_date": func.greatest(UserTxRollup.last_date, txn_date),
+            "total_expenses": UserTxRollup.total_expenses + expense,
+            "total_income": UserTxRollup.total_income + income,
+            "weekly_total": UserTxRollup.weekly_total + weekly,
+            "large_total": UserTxRollup.large_total + large,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def _rollup_recompute(db: AsyncSession, user_id: UUID) -> None:
+    """
+    Rebuild the rollup row from the transactions table.
+
+    Used on update/delete, where the date bounds cannot be maintained
+    incrementally (removing the min/max date requires a rescan anyway).
+    """
+    row = (
+        await db.execute(
+            select(
+                func.min(Transaction.date),
+                func.max(Transaction.date),
+                func.coalesce(
+                    func.sum(func.abs(Transaction.amount_signed)).filter(
+                        Transaction.is_income == False
+                    ),
+                    0,
+                ),
+                func.coalesce(
+                    func.sum(Transaction.amount_signed).filter(Transaction.is_income == True),
+                    0,
+                ),
+                func.coalesce(
+                    func.sum(func.abs(Transaction.amount_signed)).filter(
+                        and_(Transaction.is_income == False, Transaction.is_weekly == True)
+                    ),
+                    0,
+                ),
+                func.coalesce(
+                    func.sum(func.abs(Transaction.amount_signed)).filter(
+                        and_(Transaction.is_income == False, Transaction.is_weekly == False)
+                    ),
+                    0,
+                ),
+            ).where(Transaction.user_id == user_id)
+        )
+    ).one()
+
+    values = {
+        "first_date": row[0],
+        "last_date": row[1],
+        "total_expenses": row[2],
+        "total_income": row[3],
+        "weekly_total": row[4],
+        "large_total": row[5],
+    }
+    stmt = pg_insert(UserTxRollup).values(user_id=user_id, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserTxRollup.user_id],
+        set_={**values, "updated_at": func.now()},
+    )
+    await db.execute(stmt)
+
+
+def _to_read(t: Transaction) -> TransactionRead:
+    """
+    Build a TransactionRead from a trusted ORM row via model_construct.
+
+    The row already passed schema validation on the way in and the DB
+    enforces the sign constraint, so re-running Pydantic validation per
+    row on the way out is wasted CPU on large listings.
+    """
+    return TransactionRead.model_construct(
+        id=t.id,
+        user_id=t.user_id,
+        date=t.date,
+        amount_signed=t.amount_signed,
+        merchant=t.merchant,
+        category=t.category,
+        note=t.note,
+        is_income=t.is_income,
+        is_weekly=t.is_weekly,
+        income_source=t.income_source,
+        created_at=t.created_at,
+    )
+
+
+def _etag_guard(
+    request: Request,
+    response: Response,
+    current_user: User,
+    *parts: object,
+) -> Response | None:
+    """
+    HTTP revalidation for transaction-derived stats.
+
+    The ETag is a weak hash of the user's tx_version (bumped on every
+    transaction write) plus any route parameters that change the payload.
+    Returns a bodyless 304 when the client's copy is current, else stamps
+    ETag/Cache-Control headers and returns None so the handler proceeds.
+
+    Only valid for endpoints whose output depends solely on the
+    transactions table - budget-settings-dependent routes must not use it.
+    """
+    suffix = "-".join(str(p) for p in parts)
+    # The user id keeps ETags distinct across accounts: tx_version is a
+    # small per-user counter, so without it a stale If-None-Match from a
+    # previous login could 304-revalidate another user's cached stats
+    etag = f'W/"{current_user.id}-{current_user.tx_version}-{suffix}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=30"
+    return None
+
+
+async def _bump_tx_version(db: AsyncSession, user_id: UUID) -> None:
+    """Increment the user's tx_version in the same transaction as the write."""
+    await db.execute(
+        update(User).where(User.id == user_id).values(tx_version=User.tx_version + 1)
+    )
+
+
+def _parse_cursor(cursor: str) -> tuple[date, UUID]:
+    """Parse an opaque keyset cursor of the form '<iso-date>_<uuid>'."""
+    try:
+        date_part, _, id_part = cursor.partition("_")
+        return date.fromisoformat(date_part), UUID(id_part)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
 @router.get("/", response_model=list[TransactionRead])
 async def list_transactions(
     current_user: CurrentUser,
@@ -27,7 +239,10 @@ async def list_transactions(
     date_to: date | None = None,
     category: str | None = None,
     is_income: bool | None = None,
-) -> list[TransactionRead]:
+    limit: int | None = None,
+    cursor: str | None = None,
+    format: Literal["json", "ndjson"] = "json",
+):
     """
     List transactions for the current user.
 
@@ -35,6 +250,15 @@ async def list_transactions(
     - date_from/date_to: Filter by date range
     - category: Filter by category
     - is_income: Filter by income/expense
+
+    Pagination (optional):
+    - limit: Page size. When set, rows are ordered by (date, id) descending
+      and the next page cursor is '<date>_<id>' of the last row returned.
+    - cursor: Opaque keyset cursor from a previous page.
+
+    Export:
+    - format=ndjson: Stream the result set as newline-delimited JSON with a
+      server-side cursor, so memory stays flat regardless of row count.
     """
     query = select(Transaction).where(Transaction.user_id == current_user.id)
 
@@ -47,159 +271,220 @@ async def list_transactions(
     if is_income is not None:
         query = query.where(Transaction.is_income == is_income)
 
-    query = query.order_by(Transaction.date.desc(), Transaction.created_at.desc())
+    if limit is not None or cursor is not None:
+        # Keyset pagination: stable (date, id) ordering so pages don't shift
+        query = query.order_by(Transaction.date.desc(), Transaction.id.desc())
+        if cursor:
+            cursor_date, cursor_id = _parse_cursor(cursor)
+            # tuple_ emits a SQL row-value comparison; a plain Python
+            # tuple here would short-circuit and drop the id tiebreaker
+            query = query.where(
+                tuple_(Transaction.date, Transaction.id) < (cursor_date, cursor_id)
+            )
+        if limit is not None:
+            query = query.limit(limit)
+    else:
+        query = query.order_by(Transaction.date.desc(), Transaction.created_at.desc())
+
+    if format == "ndjson":
+        # Stream rows from a server-side cursor instead of materializing them
+        stream = await db.stream(query.execution_options(yield_per=1000))
+
+        async def generate():
+            async for t in stream.scalars():
+                yield _to_read(t).model_dump_json() + "\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
 
     result = await db.execute(query)
-    return [TransactionRead.model_validate(t) for t in result.scalars()]
+    return [_to_read(t) for t in result.scalars()]
+
+
+async def _summary_data(
+    db: AsyncSession,
+    user_id: UUID,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> dict:
+    result = await db.execute(
+        _SUMMARY_SQL,
+        {"uid": user_id, "date_from": date_from, "date_to": date_to},
+    )
+    row = result.one()
+
+    return {
+        "total_income": row.income_cents / 100,
+        "total_expenses": row.expense_cents / 100,
+        "net": row.net_cents / 100,
+    }
 
 
 @router.get("/summary")
 async def get_transaction_summary(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     db: DbSession,
     date_from: date | None = None,
     date_to: date | None = None,
-) -> dict:
+):
     """
     Get a summary of transactions (total income, expenses, net).
 
     Filters:
     - date_from/date_to: Filter by date range
     """
-    query = select(
-        func.sum(Transaction.amount_signed).filter(Transaction.is_income == True).label("total_income"),
-        func.sum(Transaction.amount_signed).filter(Transaction.is_income == False).label("total_expenses"),
-        func.sum(Transaction.amount_signed).label("net"),
-    ).where(Transaction.user_id == current_user.id)
+    if not_modified := _etag_guard(request, response, current_user, "summary", date_from, date_to):
+        return not_modified
+    return await _summary_data(db, current_user.id, date_from, date_to)
 
-    if date_from:
-        query = query.where(Transaction.date >= date_from)
-    if date_to:
-        query = query.where(Transaction.date <= date_to)
 
-    result = await db.execute(query)
-    row = result.one()
+async def _breakdown_data(db: AsyncSession, user_id: UUID) -> dict:
+    result = await db.execute(
+        select(UserTxRollup.weekly_total, UserTxRollup.large_total).where(
+            UserTxRollup.user_id == user_id
+        )
+    )
+    row = result.one_or_none()
+
+    weekly = float(row.weekly_total) if row else 0.0
+    large = float(row.large_total) if row else 0.0
+    total = weekly + large
 
     return {
-        "total_income": float(row.total_income or 0),
-        "total_expenses": float(row.total_expenses or 0),
-        "net": float(row.net or 0),
+        "weekly": weekly,
+        "large": large,
+        "total": total,
+        "weekly_pct": round(weekly / total * 100, 1) if total > 0 else 0,
+        "large_pct": round(large / total * 100, 1) if total > 0 else 0,
     }
 
 
 @router.get("/stats/breakdown")
 async def get_breakdown(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     db: DbSession,
-) -> dict:
+):
     """
     Get breakdown of expenses by weekly vs large/one-time.
+
+    Reads the user's rollup row (single PK lookup) instead of aggregating
+    the transactions table.
     """
-    query = select(
-        func.sum(func.abs(Transaction.amount_signed)).filter(
-            and_(Transaction.is_income == False, Transaction.is_weekly == True)
-        ).label("weekly_total"),
-        func.sum(func.abs(Transaction.amount_signed)).filter(
-            and_(Transaction.is_income == False, Transaction.is_weekly == False)
-        ).label("large_total"),
-    ).where(Transaction.user_id == current_user.id)
+    if not_modified := _etag_guard(request, response, current_user, "breakdown"):
+        return not_modified
+    return await _breakdown_data(db, current_user.id)
 
-    result = await db.execute(query)
-    row = result.one()
 
-    weekly = float(row.weekly_total or 0)
-    large = float(row.large_total or 0)
-    total = weekly + large
+async def _trend_data(db: AsyncSession, user_id: UUID, days: int) -> list[dict]:
+    end_date = date.today()
+    start_date = end_date - timedelta(days=days)
 
-    return {
-        "weekly": weekly,
-        "large": large,
-        "total": total,
-        "weekly_pct": round(weekly / total * 100, 1) if total > 0 else 0,
-        "large_pct": round(large / total * 100, 1) if total > 0 else 0,
+    result = await db.execute(
+        _TREND_SQL,
+        {"uid": user_id, "date_from": start_date, "date_to": end_date},
+    )
+    rows = result.all()
+
+    # Gap-fill missing dates with zeros: isoformat each date exactly once
+    # and keep the hot loop to a dict lookup per day.
+    by_date = {
+        row.date.isoformat(): (row.expense_cents / 100, row.income_cents / 100) for row in rows
     }
+    dates = [(start_date + timedelta(days=i)).isoformat() for i in range(days + 1)]
+    return [
+        {"date": d, "expenses": e, "income": i}
+        for d, (e, i) in ((d, by_date.get(d, (0.0, 0.0))) for d in dates)
+    ]
 
 
 @router.get("/stats/trend")
 async def get_trend(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     db: DbSession,
     days: int = 30,
-) -> list[dict]:
+):
     """
     Get daily spending trend for the past N days.
     Returns list of {date, expenses, income} for charting.
     """
-    end_date = date.today()
-    start_date = end_date - timedelta(days=days)
+    # date.today() is in the ETag because the window slides at midnight
+    if not_modified := _etag_guard(request, response, current_user, "trend", days, date.today()):
+        return not_modified
+    return await _trend_data(db, current_user.id, days)
+
+
+async def _weekly_average_data(db: AsyncSession, user_id: UUID) -> dict:
+    result = await db.execute(
+        select(
+            UserTxRollup.first_date,
+            UserTxRollup.last_date,
+            UserTxRollup.total_expenses,
+        ).where(UserTxRollup.user_id == user_id)
+    )
+    row = result.one_or_none()
 
-    query = select(
-        Transaction.date,
-        func.sum(func.abs(Transaction.amount_signed)).filter(Transaction.is_income == False).label("expenses"),
-        func.sum(Transaction.amount_signed).filter(Transaction.is_income == True).label("income"),
-    ).where(
-        Transaction.user_id == current_user.id,
-        Transaction.date >= start_date,
-        Transaction.date <= end_date,
-    ).group_by(Transaction.date).order_by(Transaction.date)
+    if row is None or not row.first_date or not row.last_date:
+        return {"weekly_average": 0, "weeks_tracked": 0, "total_expenses": 0}
 
-    result = await db.execute(query)
-    rows = result.all()
+    # Calculate number of weeks
+    days_tracked = (row.last_date - row.first_date).days + 1
+    weeks_tracked = max(days_tracked / 7, 1)
+    total_expenses = float(row.total_expenses or 0)
 
-    # Create a dict of existing data
-    data_by_date = {
-        row.date.isoformat(): {
-            "date": row.date.isoformat(),
-            "expenses": float(row.expenses or 0),
-            "income": float(row.income or 0),
-        }
-        for row in rows
+    return {
+        "weekly_average": round(total_expenses / weeks_tracked, 2),
+        "weeks_tracked": round(weeks_tracked, 1),
+        "total_expenses": total_expenses,
     }
 
-    # Fill in missing dates with zeros
-    trend = []
-    current = start_date
-    while current <= end_date:
-        date_str = current.isoformat()
-        if date_str in data_by_date:
-            trend.append(data_by_date[date_str])
-        else:
-            trend.append({"date": date_str, "expenses": 0, "income": 0})
-        current += timedelta(days=1)
-
-    return trend
-
 
 @router.get("/stats/weekly-average")
 async def get_weekly_average(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     db: DbSession,
-) -> dict:
+):
     """
     Get average weekly spending based on all transactions.
-    """
-    # Get the date range of all transactions
-    range_query = select(
-        func.min(Transaction.date).label("first_date"),
-        func.max(Transaction.date).label("last_date"),
-        func.sum(func.abs(Transaction.amount_signed)).filter(Transaction.is_income == False).label("total_expenses"),
-    ).where(Transaction.user_id == current_user.id)
 
-    result = await db.execute(range_query)
-    row = result.one()
+    Reads the user's rollup row (single PK lookup) instead of aggregating
+    the transactions table.
+    """
+    if not_modified := _etag_guard(request, response, current_user, "weekly-average"):
+        return not_modified
+    return await _weekly_average_data(db, current_user.id)
 
-    if not row.first_date or not row.last_date:
-        return {"weekly_average": 0, "weeks_tracked": 0, "total_expenses": 0}
 
-    # Calculate number of weeks
-    days_tracked = (row.last_date - row.first_date).days + 1
-    weeks_tracked = max(days_tracked / 7, 1)
-    total_expenses = float(row.total_expenses or 0)
+@router.get("/stats/bundle")
+async def get_stats_bundle(
+    request: Request,
+    response: Response,
+    current_user: CurrentUser,
+    db: DbSession,
+    days: int = 30,
+):
+    """
+    Bundle of dashboard stats in one round-trip:
+    {summary, breakdown, trend, weekly_average}.
 
+    Collapses four HTTP requests (each paying TLS + middleware + pool
+    checkout) into one. The queries run sequentially on the request's
+    session - breakdown and weekly-average are single rollup PK lookups,
+    so the win is the saved round-trips, not DB parallelism.
+    """
+    if not_modified := _etag_guard(request, response, current_user, "bundle", days, date.today()):
+        return not_modified
     return {
-        "weekly_average": round(total_expenses / weeks_tracked, 2),
-        "weeks_tracked": round(weeks_tracked, 1),
-        "total_expenses": total_expenses,
+        "summary": await _summary_data(db, current_user.id),
+        "breakdown": await _breakdown_data(db, current_user.id),
+        "trend": await _trend_data(db, current_user.id, days),
+        "weekly_average": await _weekly_average_data(db, current_user.id),
     }
 
 
@@ -257,7 +542,7 @@ async def get_week_summary(
     budget_target = float(settings.weekly_budget_target) if settings and settings.weekly_budget_target else None
     budget_remaining = (budget_target - weekly_spend) if budget_target is not None else None
 
-    all_txn_read = [TransactionRead.model_validate(t).model_dump(mode="json") for t in transactions]
+    all_txn_read = [_to_read(t).model_dump(mode="json") for t in transactions]
 
     return {
         "week_start": week_start.isoformat(),
@@ -274,15 +559,19 @@ async def get_week_summary(
 
 @router.get("/stats/multi-week")
 async def get_multi_week(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     db: DbSession,
     weeks: int = 8,
-) -> list[dict]:
+):
     """
     For the multi-week comparison bar chart.
     Groups all expenses by their Monday-Sunday week, fills empty weeks with zeros.
     """
     today = date.today()
+    if not_modified := _etag_guard(request, response, current_user, "multi-week", weeks, today):
+        return not_modified
     current_monday = _monday_of(today)
     start_monday = current_monday - timedelta(weeks=weeks - 1)
 
@@ -334,34 +623,38 @@ async def get_multi_week(
 
 @router.get("/stats/income-summary")
 async def get_income_summary(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     db: DbSession,
-) -> dict:
+):
     """
     Separate income tracking: total, by-source, recent, monthly trend.
     """
+    if not_modified := _etag_guard(request, response, current_user, "income-summary"):
+        return not_modified
     # Total income
     total_query = select(
-        func.sum(Transaction.amount_signed).label("total"),
+        func.sum(Transaction.amount_cents).label("total_cents"),
     ).where(
         Transaction.user_id == current_user.id,
         Transaction.is_income == True,
     )
     total_result = await db.execute(total_query)
-    total_income = float(total_result.scalar_one_or_none() or 0)
+    total_income = (total_result.scalar_one_or_none() or 0) / 100
 
     # By source
     source_col = func.coalesce(Transaction.income_source, "other")
     source_query = select(
         source_col.label("source"),
-        func.sum(Transaction.amount_signed).label("amount"),
+        func.sum(Transaction.amount_cents).label("amount_cents"),
     ).where(
         Transaction.user_id == current_user.id,
         Transaction.is_income == True,
     ).group_by(source_col)
     source_result = await db.execute(source_query)
     by_source = [
-        {"source": row.source, "amount": float(row.amount or 0)}
+        {"source": row.source, "amount": (row.amount_cents or 0) / 100}
         for row in source_result.all()
     ]
 
@@ -376,20 +669,20 @@ async def get_income_summary(
         .limit(10)
     )
     recent_result = await db.execute(recent_query)
-    recent = [TransactionRead.model_validate(t).model_dump(mode="json") for t in recent_result.scalars()]
+    recent = [_to_read(t).model_dump(mode="json") for t in recent_result.scalars()]
 
     # Monthly trend
     month_col = func.to_char(Transaction.date, "YYYY-MM")
     monthly_query = select(
         month_col.label("month"),
-        func.sum(Transaction.amount_signed).label("amount"),
+        func.sum(Transaction.amount_cents).label("amount_cents"),
     ).where(
         Transaction.user_id == current_user.id,
         Transaction.is_income == True,
     ).group_by(month_col).order_by(month_col)
     monthly_result = await db.execute(monthly_query)
     monthly_trend = [
-        {"month": row.month, "amount": float(row.amount or 0)}
+        {"month": row.month, "amount": (row.amount_cents or 0) / 100}
         for row in monthly_result.all()
     ]
 
@@ -420,14 +713,14 @@ async def get_balance(
 
     # Get totals
     totals_query = select(
-        func.sum(Transaction.amount_signed).filter(Transaction.is_income == True).label("total_income"),
-        func.sum(Transaction.amount_signed).filter(Transaction.is_income == False).label("total_expenses"),
+        func.sum(Transaction.amount_cents).filter(Transaction.is_income == True).label("income_cents"),
+        func.sum(Transaction.amount_cents).filter(Transaction.is_income == False).label("expense_cents"),
     ).where(Transaction.user_id == current_user.id)
     totals_result = await db.execute(totals_query)
     row = totals_result.one()
 
-    total_income = float(row.total_income or 0)
-    total_expenses = float(row.total_expenses or 0)
+    total_income = (row.income_cents or 0) / 100
+    total_expenses = (row.expense_cents or 0) / 100
     current_balance = starting_balance + total_income + total_expenses
 
     return {
@@ -450,9 +743,17 @@ async def create_transaction(
         **data.model_dump(),
     )
     db.add(new_transaction)
+    await _rollup_add(
+        db,
+        current_user.id,
+        data.date,
+        data.amount_signed,
+        data.is_income,
+        data.is_weekly,
+    )
+    await _bump_tx_version(db, current_user.id)
     await db.commit()
-    await db.refresh(new_transaction)
-    return TransactionRead.model_validate(new_transaction)
+    return _to_read(new_transaction)
 
 
 @router.put("/{transaction_id}", response_model=TransactionRead)
@@ -468,9 +769,11 @@ async def update_transaction(
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(transaction, key, value)
 
+    await db.flush()
+    await _rollup_recompute(db, current_user.id)
+    await _bump_tx_version(db, current_user.id)
     await db.commit()
-    await db.refresh(transaction)
-    return TransactionRead.model_validate(transaction)
+    return _to_read(transaction)
 
 
 @router.get("/{transaction_id}", response_model=TransactionRead)
@@ -481,7 +784,7 @@ async def get_transaction(
 ) -> TransactionRead:
     """Get a specific transaction by ID."""
     transaction = await get_user_resource_or_404(db, Transaction, transaction_id, current_user.id)
-    return TransactionRead.model_validate(transaction)
+    return _to_read(transaction)
 
 
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -491,6 +794,15 @@ async def delete_transaction(
     db: DbSession,
 ) -> None:
     """Delete a transaction."""
-    transaction = await get_user_resource_or_404(db, Transaction, transaction_id, current_user.id)
-    await db.delete(transaction)
+    # Single DELETE scoped by user_id - no need to fetch the row first
+    result = await db.execute(
+        delete(Transaction).where(
+            Transaction.id == transaction_id,
+            Transaction.user_id == current_user.id,
+        )
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource not found")
+    await _rollup_recompute(db, current_user.id)
+    await _bump_tx_version(db, current_user.id)
     await db.commit()
@@ -47,5 +47,4 @@ async def upsert_weekly_plan(
         db.add(plan)
 
     await db.commit()
-    await db.refresh(plan)
     return WeeklyPlanRead.model_validate(plan)
@@ -70,6 +70,13 @@ class Settings(BaseSettings):
             return url
         return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
 
+    # Database pool tuning
+    # Size these against worker count and the DB plan's connection limit
+    # (each uvicorn worker gets its own pool of up to size + overflow)
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_recycle_seconds: int = 1800
+
     # Auth / JWT
     jwt_secret_key: str  # Required - no default, must be set in .env
     jwt_algorithm: str = "HS256"
@@ -92,6 +99,17 @@ class Settings(BaseSettings):
     aws_s3_bucket: str
     aws_s3_region: str = "us-east-2"
     aws_s3_endpoint_url: str | None = None  # Set for MinIO/LocalStack (e.g. http://localhost:9000)
+    s3_max_pool_connections: int = 64
+    # Transfer Acceleration routes uploads/downloads through the nearest
+    # CloudFront edge (bucket must have acceleration enabled); dualstack
+    # serves the bucket over IPv6. Both are ignored when a custom
+    # endpoint (MinIO/LocalStack) is set
+    aws_s3_use_accelerate: bool = False
+    aws_s3_use_dualstack: bool = False
+    # Gzip server-side uploads that a sample probe shows are
+    # compressible (e.g. scanned PDFs with uncompressed streams);
+    # downloads decompress transparently via ContentEncoding
+    s3_gzip_uploads: bool = False
 
     # Anthropic API
     anthropic_api_key: str
@@ -110,8 +128,18 @@ class Settings(BaseSettings):
     brain_update_message_interval: int = 5
     brain_history_window: int = 10
 
+    # Chat history windowing: messages past the verbatim window get rolled
+    # into a cheap-model summary so per-turn input tokens stay bounded
+    llm_summary_model: str = "claude-3-5-haiku-latest"
+    llm_summary_max_tokens: int = 1000
+    chat_history_window_messages: int = 20
+    chat_history_summary_threshold: int = 30
+
     # PDF upload
     max_pdf_size_bytes: int = 50 * 1024 * 1024  # 50MB
+    # Sort extracted text into reading order. Costs extra CPU per page;
+    # lecture slides rarely need it, multi-column papers may
+    pdf_extract_sort: bool = False
 
 
 @lru_cache
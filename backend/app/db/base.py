@@ -6,4 +6,7 @@ from sqlalchemy.orm import DeclarativeBase
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
-    pass
+    # Fetch server-generated values (created_at/updated_at NOW() defaults,
+    # generated columns) via INSERT/UPDATE ... RETURNING in the same
+    # round-trip instead of a follow-up SELECT. Inherited by every model
+    __mapper_args__ = {"eager_defaults": True}
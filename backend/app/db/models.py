@@ -13,7 +13,10 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     ARRAY,
+    BigInteger,
     CheckConstraint,
+    Computed,
+    FetchedValue,
     ForeignKey,
     Index,
     Numeric,
@@ -22,7 +25,13 @@ from sqlalchemy import (
     UniqueConstraint,
     text,
 )
-from sqlalchemy.dialects.postgresql import CITEXT, ENUM as PGENUM, JSONB, TIMESTAMP, UUID as PGUUID
+from sqlalchemy.dialects.postgresql import (
+    ENUM as PGENUM,
+    JSONB,
+    TIMESTAMP,
+    TSVECTOR,
+    UUID as PGUUID,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -112,57 +121,117 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Case-insensitive uniqueness via an expression index; plain text
+        # avoids CITEXT's per-comparison folding (callers lowercase input)
+        Index("idx_users_email_lower", text("lower(email)"), unique=True),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, default=uuid4
     )
-    email: Mapped[Optional[str]] = mapped_column(
-        CITEXT(), unique=True, index=True, nullable=True
-    )
+    email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Bumped on every transaction write; used to derive ETags for stats reads
+    tx_version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        # Maintained by the update_updated_at_column() trigger;
+        # FetchedValue lets eager_defaults fold the new value into
+        # UPDATE...RETURNING instead of leaving the ORM copy stale
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
     auth_identities: Mapped[list["AuthIdentity"]] = relationship(
-        "AuthIdentity", back_populates="user", cascade="all, delete-orphan"
+        "AuthIdentity",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     classes: Mapped[list["Class"]] = relationship(
-        "Class", back_populates="user", cascade="all, delete-orphan"
+        "Class",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     assignments: Mapped[list["Assignment"]] = relationship(
-        "Assignment", back_populates="user", cascade="all, delete-orphan"
+        "Assignment",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     exams: Mapped[list["Exam"]] = relationship(
-        "Exam", back_populates="user", cascade="all, delete-orphan"
+        "Exam",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     notes: Mapped[list["Note"]] = relationship(
-        "Note", back_populates="user", cascade="all, delete-orphan"
+        "Note",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     time_blocks: Mapped[list["TimeBlock"]] = relationship(
-        "TimeBlock", back_populates="user", cascade="all, delete-orphan"
+        "TimeBlock",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     transactions: Mapped[list["Transaction"]] = relationship(
-        "Transaction", back_populates="user", cascade="all, delete-orphan"
+        "Transaction",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     budget_settings: Mapped[Optional["BudgetSettings"]] = relationship(
-        "BudgetSettings", back_populates="user", uselist=False, cascade="all, delete-orphan"
+        "BudgetSettings",
+        back_populates="user",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     weekly_plans: Mapped[list["WeeklyPlan"]] = relationship(
-        "WeeklyPlan", back_populates="user", cascade="all, delete-orphan"
+        "WeeklyPlan",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     pdfs: Mapped[list["PDF"]] = relationship(
-        "PDF", back_populates="user", cascade="all, delete-orphan"
+        "PDF",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     chat_conversations: Mapped[list["ChatConversation"]] = relationship(
-        "ChatConversation", back_populates="user", cascade="all, delete-orphan"
+        "ChatConversation",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     brain_memories: Mapped[list["BrainMemory"]] = relationship(
-        "BrainMemory", back_populates="user", cascade="all, delete-orphan"
+        "BrainMemory",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
 
@@ -224,6 +293,14 @@ class Class(Base):
             postgresql_where=text("code IS NULL"),
         ),
         Index("idx_classes_semester", "user_id", "semester"),
+        # jsonb_path_ops GIN: much smaller than default jsonb_ops and fast
+        # for @> containment lookups (link searches must use @>, not ->>)
+        Index(
+            "idx_classes_links_json_gin",
+            "links_json",
+            postgresql_using="gin",
+            postgresql_ops={"links_json": "jsonb_path_ops"},
+        ),
         CheckConstraint(
             "color IS NULL OR color ~* '^#[0-9A-Fa-f]{6}$'",
             name="valid_color",
@@ -241,12 +318,17 @@ class Class(Base):
     semester: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g., "Spring 2026"
     color: Mapped[Optional[str]] = mapped_column(String(7), nullable=True)  # Hex color
     instructor: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    links_json: Mapped[Optional[dict]] = mapped_column(JSONB, default=dict)
+    links_json: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb")
+    )
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
@@ -279,7 +361,13 @@ class Assignment(Base):
     __table_args__ = (
         Index("idx_assignments_user_planned_start", "user_id", "planned_start_day"),
         Index("idx_assignments_user_due_date", "user_id", "due_date"),
-        Index("idx_assignments_user_status", "user_id", "status"),
+        # Partial index over the hot subset: dashboards nearly always want
+        # unfinished work ordered by due date
+        Index(
+            "idx_assignments_user_active",
+            "user_id", "due_date",
+            postgresql_where=text("status <> 'finished'"),
+        ),
         CheckConstraint(
             "estimated_minutes IS NULL OR estimated_minutes > 0",
             name="valid_estimated_minutes",
@@ -317,7 +405,10 @@ class Assignment(Base):
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
@@ -366,7 +457,10 @@ class Exam(Base):
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
@@ -387,6 +481,7 @@ class Note(Base):
     __table_args__ = (
         Index("idx_notes_user_updated_at", "user_id", "updated_at"),
         Index("idx_notes_tags", "tags", postgresql_using="gin"),
+        Index("idx_notes_content_tsv_gin", "content_tsv", postgresql_using="gin"),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -403,13 +498,27 @@ class Note(Base):
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False, default="Untitled")
     content_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Markdown content
-    content_json: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # Deprecated, unused
+    # Generated search vector over title + content so the list endpoint's
+    # q filter is a GIN index scan instead of ILIKE '%...%' seq scans.
+    # Deferred: only the WHERE clause ever uses it
+    content_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title,'') || ' ' || coalesce(content_text,''))",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
     tags: Mapped[list[str]] = mapped_column(ARRAY(Text), default=list)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
@@ -457,7 +566,10 @@ class TimeBlock(Base):
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
@@ -472,6 +584,17 @@ class Transaction(Base):
     __table_args__ = (
         Index("idx_transactions_user_date", "user_id", "date"),
         Index("idx_transactions_user_category", "user_id", "category"),
+        # BRIN: transactions are append-mostly in date order, so a few
+        # pages of BRIN ranges serve wide date-range scans cheaply
+        Index(
+            "idx_transactions_date_brin",
+            "date",
+            postgresql_using="brin",
+            # Finer block ranges than the 128-page default: the table is
+            # modest-sized, so smaller ranges keep date filters selective
+            # while the index stays a few KB
+            postgresql_with={"pages_per_range": 32},
+        ),
         CheckConstraint(
             "(is_income = TRUE AND amount_signed > 0) OR (is_income = FALSE AND amount_signed <= 0)",
             name="valid_amount_sign",
@@ -486,6 +609,11 @@ class Transaction(Base):
     )
     date: Mapped[dt.date] = mapped_column(nullable=False)
     amount_signed: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
+    # DB-generated integer-cents mirror of amount_signed; int8 sums are much
+    # cheaper than numeric and decode to Python int instead of Decimal
+    amount_cents: Mapped[int] = mapped_column(
+        BigInteger, Computed("(amount_signed * 100)::bigint", persisted=True), nullable=False
+    )
     merchant: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -500,6 +628,39 @@ class Transaction(Base):
     user: Mapped["User"] = relationship("User", back_populates="transactions")
 
 
+class UserTxRollup(Base):
+    """
+    Per-user transaction rollup for O(1) stats reads.
+
+    Tracks running totals and date bounds so /stats/weekly-average and
+    /stats/breakdown become single PK lookups instead of full-table
+    aggregations. Maintained transactionally by the transaction write
+    handlers (incremental on insert, recomputed on update/delete).
+    """
+
+    __tablename__ = "user_tx_rollup"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    first_date: Mapped[Optional[date]] = mapped_column(nullable=True)
+    last_date: Mapped[Optional[date]] = mapped_column(nullable=True)
+    # Absolute-value expense totals; income kept signed (always positive)
+    total_expenses: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, server_default="0")
+    total_income: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, server_default="0")
+    weekly_total: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, server_default="0")
+    large_total: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
+
+    # Relationships
+    user: Mapped["User"] = relationship("User")
+
+
 class BudgetSettings(Base):
     """Per-user budget configuration (1:1 with users)."""
 
@@ -521,7 +682,10 @@ class BudgetSettings(Base):
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
@@ -552,7 +716,10 @@ class WeeklyPlan(Base):
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
@@ -596,8 +763,13 @@ class PDF(Base):
     )
     file_size_bytes: Mapped[Optional[int]] = mapped_column(nullable=True)
 
-    # Extracted content for LLM context
-    extracted_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Extracted content for LLM context. Deferred so list queries don't
+    # drag the (potentially multi-MB) TOASTed text off disk; endpoints that
+    # need it opt in with undefer(), and accidental lazy loads raise
+    # instead of issuing a hidden round-trip
+    extracted_text: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_raiseload=True
+    )
     extraction_status: Mapped[str] = mapped_column(
         String(), nullable=False, server_default="pending"
     )
@@ -608,7 +780,10 @@ class PDF(Base):
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
@@ -625,7 +800,15 @@ class ChatConversation(Base):
     """
 
     __tablename__ = "chat_conversations"
-    __table_args__ = (Index("idx_chat_conversations_user_id", "user_id"),)
+    __table_args__ = (
+        Index("idx_chat_conversations_user_id", "user_id"),
+        # GIN on the context arrays so "conversations referencing X"
+        # (context_*_ids @> ARRAY[id]) is an index scan, not unnest+seqscan
+        Index("idx_chat_conv_ctx_class_gin", "context_class_ids", postgresql_using="gin"),
+        Index("idx_chat_conv_ctx_assignment_gin", "context_assignment_ids", postgresql_using="gin"),
+        Index("idx_chat_conv_ctx_pdf_gin", "context_pdf_ids", postgresql_using="gin"),
+        Index("idx_chat_conv_ctx_note_gin", "context_note_ids", postgresql_using="gin"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, default=uuid4
@@ -651,18 +834,38 @@ class ChatConversation(Base):
         ARRAY(PGUUID(as_uuid=True)), nullable=False, server_default="{}"
     )
 
+    # Running count of user messages, maintained on insert so the brain
+    # update trigger doesn't re-count the whole history each turn
+    user_message_count: Mapped[int] = mapped_column(
+        nullable=False, server_default="0"
+    )
+
+    # Rolling summary of messages older than the verbatim history window;
+    # history_summary_count is how many leading messages it covers
+    history_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    history_summary_count: Mapped[int] = mapped_column(
+        nullable=False, server_default="0"
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="chat_conversations")
     messages: Mapped[list["ChatMessage"]] = relationship(
-        "ChatMessage", back_populates="conversation", cascade="all, delete-orphan"
+        "ChatMessage",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
 
@@ -708,7 +911,15 @@ class BrainMemory(Base):
 
     __tablename__ = "brain_memories"
     __table_args__ = (
-        UniqueConstraint("user_id", "class_id", "brain_type", name="unique_user_class_brain"),
+        # NULLS NOT DISTINCT so the global brain (class_id NULL) conflicts
+        # like any other row, making INSERT ... ON CONFLICT upserts safe
+        UniqueConstraint(
+            "user_id",
+            "class_id",
+            "brain_type",
+            name="unique_user_class_brain",
+            postgresql_nulls_not_distinct=True,
+        ),
         Index("idx_brain_memories_user_id", "user_id"),
         Index("idx_brain_memories_class_id", "class_id"),
     )
@@ -742,7 +953,10 @@ class BrainMemory(Base):
         TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     # Relationships
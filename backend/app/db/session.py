@@ -10,20 +10,49 @@ from app.config import get_settings
 settings = get_settings()
 
 # Build connect_args for SSL if needed (e.g., Neon)
-connect_args: dict = {}
+# - prepared_statement_cache_size: repeat executions of hot statements skip
+#   the parse step (cached per connection)
+# - jit off: our queries are short OLTP statements; Postgres JIT warm-up
+#   costs more than it saves at this size
+# - tcp_keepalives_*: the server probes idle connections so half-open
+#   sockets are torn down quickly; together with pool_recycle this stands
+#   in for the per-checkout SELECT 1 that pool_pre_ping would issue
+connect_args: dict = {
+    "prepared_statement_cache_size": 256,
+    "server_settings": {
+        "jit": "off",
+        "tcp_keepalives_idle": "60",
+        "tcp_keepalives_interval": "10",
+        "tcp_keepalives_count": "3",
+    },
+}
 if settings.database_requires_ssl:
     ssl_context = ssl.create_default_context()
     ssl_context.check_hostname = False
     ssl_context.verify_mode = ssl.CERT_NONE
     connect_args["ssl"] = ssl_context
 
-# Create async engine
+# Create async engine (one shared engine per process; the pool is sized
+# from settings so it can be tuned against worker count and the DB plan's
+# connection limit without a code change)
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    # Room for every distinct statement shape the app emits, so hot ORM
+    # selects always hit the compiled-SQL cache instead of recompiling
+    query_cache_size=1000,
+    # No pre-ping: it cost a SELECT 1 round-trip on every checkout. Stale
+    # connections are bounded by pool_recycle + TCP keepalives instead,
+    # and the pool invalidates on disconnect errors as a last resort
+    pool_pre_ping=False,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    # Fail fast instead of queueing forever when the pool is exhausted
+    pool_timeout=10,
+    # LIFO keeps a small hot set of connections warm and lets idle ones
+    # age out via pool_recycle
+    pool_use_lifo=True,
     connect_args=connect_args,
 )
 
@@ -37,11 +66,20 @@ AsyncSessionLocal = async_sessionmaker(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency for database sessions."""
+    """
+    FastAPI dependency for database sessions.
+
+    The trailing commit only fires when the unit of work actually has
+    pending ORM changes - read-only requests skip the COMMIT round-trip
+    and rely on the pool's reset-on-return rollback. Handlers that write
+    via Core statements (execute(update/delete/insert)) must commit
+    explicitly, which all current ones do.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction() and (session.new or session.dirty or session.deleted):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -6,7 +6,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
 
 # Type aliases for enums (used as literals for API validation)
 AssignmentStatusType = Literal["not_started", "in_progress", "almost_done", "finished"]
@@ -32,7 +32,7 @@ class AssignmentCreate(AssignmentBase):
     class_id: UUID | None = None
 
 
-class AssignmentRead(AssignmentBase):
+class AssignmentRead(AssignmentBase, ReadBaseSchema):
     """Schema for reading assignment data."""
 
     id: UUID
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
 
 
 class GoogleAuthRequest(BaseSchema):
@@ -14,7 +14,7 @@ class GoogleAuthRequest(BaseSchema):
     id_token: str = Field(..., description="Google OAuth id_token from frontend")
 
 
-class TokenResponse(BaseSchema):
+class TokenResponse(ReadBaseSchema):
     """Response schema for successful authentication."""
 
     access_token: str
@@ -22,7 +22,7 @@ class TokenResponse(BaseSchema):
     expires_in: int = Field(..., description="Token expiry in seconds")
 
 
-class AuthIdentityRead(BaseSchema):
+class AuthIdentityRead(ReadBaseSchema):
     """Schema for reading auth identity (admin/debug use)."""
 
     id: UUID
@@ -16,6 +16,27 @@ class BaseSchema(BaseModel):
     )
 
 
+class ReadBaseSchema(BaseSchema):
+    """Base for response-only schemas built from ORM rows.
+
+    Responses are constructed once and returned, never mutated, so the
+    per-attribute revalidation and string stripping that input schemas
+    want is pure overhead here; frozen documents (and enforces) the
+    write-once usage.
+
+    When a Read schema inherits a field-carrying base, list this class
+    last (e.g. ``class FooRead(FooBase, ReadBaseSchema)``) so its config
+    overrides the input-oriented one.
+    """
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        str_strip_whitespace=False,
+        validate_assignment=False,
+        frozen=True,
+    )
+
+
 class TimestampMixin(BaseModel):
     """Mixin for created_at/updated_at timestamps."""
 
@@ -6,10 +6,10 @@ from uuid import UUID
 
 from pydantic import Field
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
 
 
-class BudgetSettingsRead(BaseSchema):
+class BudgetSettingsRead(ReadBaseSchema):
     """Schema for reading budget settings."""
 
     user_id: UUID
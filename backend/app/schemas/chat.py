@@ -1,11 +1,16 @@
 """Pydantic schemas for chat operations."""
 
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from app.schemas.base import BaseSchema, IDMixin, TimestampMixin
+from app.schemas.base import IDMixin, ReadBaseSchema, TimestampMixin
+
+# Shared alias for the context-id fields: one annotation (and one
+# pydantic-core validator definition) reused across all four fields
+UUIDList = Annotated[list[UUID], Field(default_factory=list)]
 
 
 # Request schemas
@@ -13,10 +18,10 @@ class ConversationCreateRequest(BaseModel):
     """Request to create a new conversation."""
 
     title: str | None = "New Conversation"
-    context_class_ids: list[UUID] = Field(default_factory=list)
-    context_assignment_ids: list[UUID] = Field(default_factory=list)
-    context_pdf_ids: list[UUID] = Field(default_factory=list)
-    context_note_ids: list[UUID] = Field(default_factory=list)
+    context_class_ids: UUIDList
+    context_assignment_ids: UUIDList
+    context_pdf_ids: UUIDList
+    context_note_ids: UUIDList
 
 
 class ChatMessageRequest(BaseModel):
@@ -35,7 +40,7 @@ class ConversationUpdateContextRequest(BaseModel):
 
 
 # Response schemas
-class ChatMessageResponse(BaseSchema, IDMixin):
+class ChatMessageResponse(ReadBaseSchema, IDMixin):
     """Chat message response."""
 
     conversation_id: UUID
@@ -44,7 +49,7 @@ class ChatMessageResponse(BaseSchema, IDMixin):
     created_at: datetime
 
 
-class ConversationResponse(BaseSchema, IDMixin, TimestampMixin):
+class ConversationResponse(ReadBaseSchema, IDMixin, TimestampMixin):
     """Conversation response."""
 
     user_id: UUID
@@ -68,7 +73,7 @@ class ConversationListResponse(BaseModel):
     total: int
 
 
-class BrainResponse(BaseSchema):
+class BrainResponse(ReadBaseSchema):
     """Brain memory response."""
 
     content: str
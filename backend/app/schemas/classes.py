@@ -6,7 +6,32 @@ from uuid import UUID
 
 from pydantic import Field, field_validator
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _coalesce_links_json(v: dict[str, Any] | None) -> dict[str, Any]:
+    """Map an explicit null to {}: the DB column is NOT NULL.
+
+    exclude_unset keeps explicitly-sent nulls, so without this a
+    {"links_json": null} PATCH would pass validation and then fail at
+    commit with an IntegrityError.
+    """
+    return v if v is not None else {}
+
+
+def _validate_color(v: str | None) -> str | None:
+    """Check #RRGGBB format with set membership instead of a regex.
+
+    Runs on every class create/update and every ORM->ClassRead
+    conversion, so it avoids invoking the regex engine per instance.
+    """
+    if v is None:
+        return v
+    if len(v) != 7 or v[0] != "#" or not _HEX_DIGITS.issuperset(v[1:]):
+        raise ValueError("color must be in #RRGGBB format")
+    return v
 
 
 class ClassBase(BaseSchema):
@@ -15,17 +40,13 @@ class ClassBase(BaseSchema):
     name: str = Field(..., min_length=1, max_length=255)
     code: str | None = Field(None, max_length=50)
     semester: str = Field(..., min_length=1, max_length=50)
-    color: str | None = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: str | None = None
     instructor: str | None = Field(None, max_length=255)
-    links_json: dict[str, Any] | None = Field(default_factory=dict)
-
-    @field_validator("links_json", mode="before")
-    @classmethod
-    def ensure_dict(cls, v: Any) -> dict:
-        """Ensure links_json is a dict."""
-        if v is None:
-            return {}
-        return v
+    # Non-optional: the DB column is NOT NULL with a '{}' default, so no
+    # per-instance coalescing validator is needed
+    links_json: dict[str, Any] = Field(default_factory=dict)
+
+    _check_color = field_validator("color")(_validate_color)
 
 
 class ClassCreate(ClassBase):
@@ -34,7 +55,7 @@ class ClassCreate(ClassBase):
     pass
 
 
-class ClassRead(ClassBase):
+class ClassRead(ClassBase, ReadBaseSchema):
     """Schema for reading class data."""
 
     id: UUID
@@ -49,6 +70,9 @@ class ClassUpdate(BaseSchema):
     name: str | None = Field(None, min_length=1, max_length=255)
     code: str | None = Field(None, max_length=50)
     semester: str | None = Field(None, min_length=1, max_length=50)
-    color: str | None = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: str | None = None
     instructor: str | None = Field(None, max_length=255)
     links_json: dict[str, Any] | None = None
+
+    _check_color = field_validator("color")(_validate_color)
+    _coalesce_links = field_validator("links_json")(_coalesce_links_json)
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
 
 
 class ExamBase(BaseSchema):
@@ -24,7 +24,7 @@ class ExamCreate(ExamBase):
     class_id: UUID | None = None
 
 
-class ExamRead(ExamBase):
+class ExamRead(ExamBase, ReadBaseSchema):
     """Schema for reading exam data."""
 
     id: UUID
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
 
 
 class NoteBase(BaseSchema):
@@ -29,7 +29,7 @@ class NoteCreate(NoteBase):
     assignment_id: UUID | None = None
 
 
-class NoteRead(NoteBase):
+class NoteRead(NoteBase, ReadBaseSchema):
     """Schema for reading note data."""
 
     id: UUID
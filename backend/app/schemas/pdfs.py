@@ -5,7 +5,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from app.schemas.base import BaseSchema, IDMixin, TimestampMixin
+from app.schemas.base import BaseSchema, IDMixin, ReadBaseSchema, TimestampMixin
 
 
 # Request schemas
@@ -39,7 +39,7 @@ class PDFBase(BaseSchema):
     assignment_id: UUID | None = None
 
 
-class PDFResponse(PDFBase, IDMixin, TimestampMixin):
+class PDFResponse(PDFBase, IDMixin, TimestampMixin, ReadBaseSchema):
     """Full PDF response."""
 
     user_id: UUID
@@ -6,13 +6,13 @@ from uuid import UUID
 
 from pydantic import Field, model_validator
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
 
 TimeBlockKindType = Literal["assignment", "meeting", "class", "personal"]
 
 
-class TimeBlockBase(BaseSchema):
-    """Base time block schema."""
+class _TimeBlockFields(BaseSchema):
+    """Time block fields, without the range validator (for read paths)."""
 
     start_datetime: datetime
     end_datetime: datetime
@@ -20,6 +20,10 @@ class TimeBlockBase(BaseSchema):
     title_override: str | None = Field(None, max_length=255)
     notes: str | None = None
 
+
+class TimeBlockBase(_TimeBlockFields):
+    """Base time block schema with input validation."""
+
     @model_validator(mode="after")
     def validate_time_range(self) -> "TimeBlockBase":
         """Ensure end_datetime > start_datetime."""
@@ -34,8 +38,13 @@ class TimeBlockCreate(TimeBlockBase):
     assignment_id: UUID | None = None
 
 
-class TimeBlockRead(TimeBlockBase):
-    """Schema for reading time block data."""
+class TimeBlockRead(_TimeBlockFields, ReadBaseSchema):
+    """Schema for reading time block data.
+
+    Inherits the fields-only base: the time-range invariant is enforced
+    by the valid_time_range DB constraint, so rows don't re-run the
+    validator on load.
+    """
 
     id: UUID
     user_id: UUID
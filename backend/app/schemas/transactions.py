@@ -6,7 +6,7 @@ from uuid import UUID
 
 from pydantic import Field, model_validator
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
 
 EXPENSE_CATEGORIES = [
     "food", "transport", "entertainment", "shopping",
@@ -14,8 +14,8 @@ EXPENSE_CATEGORIES = [
 ]
 
 
-class TransactionBase(BaseSchema):
-    """Base transaction schema."""
+class _TransactionFields(BaseSchema):
+    """Transaction fields, without the sign validator (for read paths)."""
 
     date: _dt.date
     amount_signed: Decimal = Field(..., decimal_places=2)
@@ -26,6 +26,10 @@ class TransactionBase(BaseSchema):
     is_weekly: bool = False
     income_source: str | None = Field(None, max_length=50)
 
+
+class TransactionBase(_TransactionFields):
+    """Base transaction schema with input validation."""
+
     @model_validator(mode="after")
     def validate_amount_sign(self) -> "TransactionBase":
         """Ensure amount sign matches is_income flag."""
@@ -54,8 +58,13 @@ class TransactionUpdate(BaseSchema):
     income_source: str | None = Field(None, max_length=50)
 
 
-class TransactionRead(TransactionBase):
-    """Schema for reading transaction data."""
+class TransactionRead(_TransactionFields, ReadBaseSchema):
+    """Schema for reading transaction data.
+
+    Inherits the fields-only base: the sign invariant is enforced by the
+    valid_amount_sign DB constraint, so rows don't re-run the validator
+    on load.
+    """
 
     id: UUID
     user_id: UUID
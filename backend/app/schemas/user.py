@@ -1,21 +1,28 @@
 """User schemas."""
 
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import EmailStr, Field
+from pydantic import Field, StringConstraints
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
+
+# Shape check only: the address comes from a verified Google OAuth token,
+# so the full EmailStr/IDNA machinery is overkill here
+EmailField = Annotated[
+    str, StringConstraints(max_length=320, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+]
 
 
 class UserCreate(BaseSchema):
     """Schema for creating a user (internal use - users created via OAuth)."""
 
-    email: EmailStr | None = None
+    email: EmailField | None = None
     name: str = Field(..., min_length=1, max_length=255)
 
 
-class UserRead(BaseSchema):
+class UserRead(ReadBaseSchema):
     """Schema for reading user data."""
 
     id: UUID
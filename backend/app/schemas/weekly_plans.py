@@ -3,10 +3,10 @@
 from datetime import datetime
 from uuid import UUID
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, ReadBaseSchema
 
 
-class WeeklyPlanRead(BaseSchema):
+class WeeklyPlanRead(ReadBaseSchema):
     """Schema for reading a weekly plan."""
 
     id: UUID
@@ -0,0 +1,16 @@
+"""Shared HTTP client for outbound Anthropic API calls."""
+
+import httpx
+from anthropic import DefaultAsyncHttpxClient
+
+# One connection pool for every Anthropic client in the process. HTTP/2
+# multiplexes concurrent chat/brain/summary calls over a single TLS
+# connection, and keep-alive reuse skips the TCP+TLS setup that separate
+# per-service pools paid on cold calls. DefaultAsyncHttpxClient is the
+# SDK's httpx.AsyncClient subclass, so its transport defaults still
+# apply. Closed in the app lifespan.
+shared_http_client = DefaultAsyncHttpxClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+)
@@ -0,0 +1,118 @@
+"""Shared retry helpers for Anthropic API calls."""
+
+import asyncio
+import functools
+import inspect
+import logging
+import random
+
+from anthropic import APIConnectionError, APIStatusError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Transient error types that warrant retrying
+_RETRYABLE_ERRORS = (APIConnectionError, RateLimitError)
+
+
+def compute_backoff(
+    error: Exception,
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> float:
+    """
+    Exponential backoff with full jitter, capped at max_delay.
+
+    The jitter term decorrelates concurrent callers that hit the same
+    rate limit together - without it every retry wave wakes at the same
+    instant and re-triggers the limit. A provider-sent Retry-After
+    header is honored up to the cap.
+
+    Args:
+        error: The exception that triggered the retry.
+        attempt: Zero-based attempt number.
+        base_delay: Base delay in seconds (doubles each attempt).
+        max_delay: Upper bound on the returned delay.
+
+    Returns:
+        Delay in seconds to sleep before the next attempt.
+    """
+    delay = min(max_delay, base_delay * (2**attempt) + random.uniform(0, base_delay))
+
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            delay = max(delay, min(float(retry_after), max_delay))
+        except ValueError:
+            pass
+
+    return delay
+
+
+def async_retry(
+    *,
+    retryable: tuple[type[Exception], ...] = _RETRYABLE_ERRORS,
+    overloaded_status: int = 529,
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+):
+    """
+    Retry an async function or async generator on transient API errors.
+
+    Retries connection errors, rate limits, and the Anthropic 529
+    overload status with jittered exponential backoff; everything else
+    propagates immediately, as does the last error once attempts are
+    exhausted. For async generators the retry only fires if the failure
+    happens before the first yield - chunks already emitted have reached
+    the client and must not be duplicated.
+    """
+
+    def _should_retry(error: Exception) -> bool:
+        if isinstance(error, retryable):
+            return True
+        return isinstance(error, APIStatusError) and error.status_code == overloaded_status
+
+    def decorator(fn):
+        if inspect.isasyncgenfunction(fn):
+
+            @functools.wraps(fn)
+            async def gen_wrapper(*args, **kwargs):
+                for attempt in range(max_attempts):
+                    yielded = False
+                    try:
+                        async for item in fn(*args, **kwargs):
+                            yielded = True
+                            yield item
+                        return
+                    except Exception as e:
+                        if yielded or not _should_retry(e) or attempt == max_attempts - 1:
+                            raise
+                        delay = compute_backoff(e, attempt, base_delay, max_delay)
+                        logger.warning(
+                            "Anthropic API transient error (attempt %d/%d), retrying in %.1fs: %s",
+                            attempt + 1, max_attempts, delay, str(e),
+                        )
+                        await asyncio.sleep(delay)
+
+            return gen_wrapper
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    if not _should_retry(e) or attempt == max_attempts - 1:
+                        raise
+                    delay = compute_backoff(e, attempt, base_delay, max_delay)
+                    logger.warning(
+                        "Anthropic API transient error (attempt %d/%d), retrying in %.1fs: %s",
+                        attempt + 1, max_attempts, delay, str(e),
+                    )
+                    await asyncio.sleep(delay)
+
+        return wrapper
+
+    return decorator
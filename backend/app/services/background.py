@@ -0,0 +1,67 @@
+"""Bounded background queue for post-turn work (brain updates, summaries).
+
+Jobs submitted here run on a single worker task started in the app
+lifespan. Compared with bare asyncio.create_task this keeps a strong
+reference to pending work (fire-and-forget tasks can be garbage
+collected mid-flight), bounds memory under a burst, and serializes the
+non-critical LLM side calls so they can't pile up against the API.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+_QUEUE_MAX = 1000
+
+queue: asyncio.Queue[Callable[[], Awaitable[None]]] = asyncio.Queue(maxsize=_QUEUE_MAX)
+_worker_task: asyncio.Task | None = None
+
+
+def submit(job: Callable[[], Awaitable[None]]) -> None:
+    """
+    Enqueue a no-argument coroutine factory for background execution.
+
+    When the queue is full the oldest pending job is dropped - these
+    jobs are best-effort by design, and bounded memory matters more
+    than completeness under a burst.
+    """
+    while True:
+        try:
+            queue.put_nowait(job)
+            return
+        except asyncio.QueueFull:
+            with contextlib.suppress(asyncio.QueueEmpty):
+                queue.get_nowait()
+                queue.task_done()
+                logger.warning("Background queue full, dropped oldest job")
+
+
+async def _worker() -> None:
+    """Run queued jobs one at a time; failures are logged, never raised."""
+    while True:
+        job = await queue.get()
+        try:
+            await job()
+        except Exception:
+            logger.exception("Background job failed")
+        finally:
+            queue.task_done()
+
+
+def start() -> None:
+    """Start the worker task (called from the app lifespan)."""
+    global _worker_task
+    _worker_task = asyncio.create_task(_worker())
+
+
+async def stop() -> None:
+    """Cancel the worker task (called from the app lifespan)."""
+    global _worker_task
+    if _worker_task is not None:
+        _worker_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _worker_task
+        _worker_task = None
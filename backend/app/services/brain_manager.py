@@ -1,73 +1,60 @@
 """Brain memory management service for LLM context."""
 
-import asyncio
 import logging
+import re
 from uuid import UUID
-from anthropic import AsyncAnthropic, APIConnectionError, RateLimitError, APIStatusError
+from anthropic import AsyncAnthropic
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.db.models import BrainMemory, ChatConversation
+from app.services._http import shared_http_client
+from app.services._retry import async_retry
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Transient error types that warrant retrying
-_RETRYABLE_ERRORS = (APIConnectionError, RateLimitError)
+# Explicit memory triggers, compiled once: a single case-insensitive pass
+# over the message instead of lowercasing it and substring-scanning per
+# keyword
+_MEMORY_TRIGGER_RE = re.compile(
+    r"remember|important|always|prefer|don't forget", re.IGNORECASE
+)
 
+# Brain-update system prompt. The static instructions are a separate
+# cache_control-marked block so Anthropic's prompt cache can reuse them
+# across calls; only the current brain content varies per call
+_BRAIN_UPDATE_SYSTEM_BLOCK = {
+    "type": "text",
+    "text": """You are a memory system for a student assistant.
 
-async def _retry_anthropic(coro_factory, *, max_attempts: int = 3, base_delay: float = 1.0):
-    """
-    Retry an Anthropic API call with exponential backoff.
-
-    Args:
-        coro_factory: Callable that returns a new coroutine each invocation.
-        max_attempts: Maximum number of attempts.
-        base_delay: Base delay in seconds (doubles each retry).
+Analyze the conversation and update the brain with:
+- New concepts or topics learned
+- Preferences or patterns (study habits, question types)
+- Recurring questions or difficulties
+- Important insights
 
-    Returns:
-        The result of the coroutine.
-    """
-    last_error = None
-    for attempt in range(max_attempts):
-        try:
-            return await coro_factory()
-        except _RETRYABLE_ERRORS as e:
-            last_error = e
-            if attempt < max_attempts - 1:
-                delay = base_delay * (2 ** attempt)
-                logger.warning(
-                    "Anthropic API transient error (attempt %d/%d), retrying in %.1fs: %s",
-                    attempt + 1, max_attempts, delay, str(e),
-                )
-                await asyncio.sleep(delay)
-            else:
-                raise
-        except APIStatusError as e:
-            # Non-retryable server errors (4xx except rate limit, 5xx that aren't transient)
-            if e.status_code == 529:  # Overloaded
-                last_error = e
-                if attempt < max_attempts - 1:
-                    delay = base_delay * (2 ** attempt)
-                    logger.warning(
-                        "Anthropic API overloaded (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1, max_attempts, delay,
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    raise
-            else:
-                raise
-    raise last_error  # Should never reach here
+Return ONLY the updated brain content as Markdown. Be concise and organized.
+If there's no new information worth remembering, return the current content unchanged.""",
+    "cache_control": {"type": "ephemeral"},
+}
 
 
 class BrainManager:
     """Manages persistent brain memories for user context."""
 
     def __init__(self):
-        """Initialize Anthropic client."""
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        """Initialize Anthropic client on the shared HTTP/2 pool."""
+        self.client = AsyncAnthropic(
+            api_key=settings.anthropic_api_key, http_client=shared_http_client
+        )
+
+    @async_retry()
+    async def _create_message(self, **kwargs):
+        """Call the Anthropic messages API with shared retry policy."""
+        return await self.client.messages.create(**kwargs)
 
     async def get_or_create_brain(
         self,
@@ -98,21 +85,99 @@ class BrainManager:
         result = await db.execute(stmt)
         brain = result.scalar_one_or_none()
 
-        # Create if doesn't exist
+        # Create if doesn't exist. The select-first keeps the common case
+        # read-only (no commit, no row churn); the miss path is an atomic
+        # upsert so concurrent first turns can't insert duplicates - the
+        # NULLS NOT DISTINCT unique constraint makes the global brain
+        # (class_id NULL) conflict like any other row, and the no-op
+        # DO UPDATE lets RETURNING hand back whichever row won the race
         if brain is None:
-            brain = BrainMemory(
-                user_id=user_id,
-                class_id=class_id,
-                brain_type=brain_type,
-                content="",
-                update_count=0,
+            stmt = (
+                pg_insert(BrainMemory)
+                .values(
+                    user_id=user_id,
+                    class_id=class_id,
+                    brain_type=brain_type,
+                    content="",
+                    update_count=0,
+                )
+                .on_conflict_do_update(
+                    constraint="unique_user_class_brain",
+                    set_={"brain_type": brain_type},
+                )
+                .returning(BrainMemory)
             )
-            db.add(brain)
+            result = await db.execute(stmt)
+            brain = result.scalar_one()
             await db.commit()
-            await db.refresh(brain)
 
         return brain
 
+    async def get_or_create_brains_bulk(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        class_ids: list[UUID],
+    ) -> dict[UUID, BrainMemory]:
+        """
+        Get class brains for many classes at once, creating missing ones.
+
+        One SELECT ... IN fetches the existing brains and missing rows are
+        inserted together with add_all + a single commit, so the round-trip
+        count stays O(1) in the number of classes instead of a SELECT and
+        potential INSERT per class.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            class_ids: Class IDs to fetch brains for
+
+        Returns:
+            Mapping of class_id to BrainMemory
+        """
+        if not class_ids:
+            return {}
+
+        stmt = select(BrainMemory).where(
+            BrainMemory.user_id == user_id,
+            BrainMemory.class_id.in_(class_ids),
+            BrainMemory.brain_type == "class",
+        )
+        result = await db.execute(stmt)
+        brains = {brain.class_id: brain for brain in result.scalars()}
+
+        # Same race-safe upsert as get_or_create_brain, multi-row: a
+        # concurrent request creating the same brains resolves to the
+        # existing rows instead of an IntegrityError
+        missing = [class_id for class_id in class_ids if class_id not in brains]
+        if missing:
+            stmt = (
+                pg_insert(BrainMemory)
+                .values(
+                    [
+                        {
+                            "user_id": user_id,
+                            "class_id": class_id,
+                            "brain_type": "class",
+                            "content": "",
+                            "update_count": 0,
+                        }
+                        for class_id in missing
+                    ]
+                )
+                .on_conflict_do_update(
+                    constraint="unique_user_class_brain",
+                    set_={"brain_type": "class"},
+                )
+                .returning(BrainMemory)
+            )
+            result = await db.execute(stmt)
+            for brain in result.scalars():
+                brains[brain.class_id] = brain
+            await db.commit()
+
+        return brains
+
     async def update_brain_after_conversation(
         self,
         db: AsyncSession,
@@ -132,35 +197,29 @@ class BrainManager:
         Returns:
             Updated brain content
         """
-        # Prepare prompt for Claude to analyze and update brain
+        # Prepare prompt for Claude to analyze and update brain: cached
+        # static instructions + the current brain content as a dynamic block
         current_content = brain.content if brain.content else "No existing knowledge yet."
 
-        system_prompt = f"""You are a memory system for a student assistant.
-
-Current brain content:
-{current_content}
+        system_prompt = [
+            _BRAIN_UPDATE_SYSTEM_BLOCK,
+            {"type": "text", "text": f"Current brain content:\n{current_content}"},
+        ]
 
-Analyze the conversation and update the brain with:
-- New concepts or topics learned
-- Preferences or patterns (study habits, question types)
-- Recurring questions or difficulties
-- Important insights
-
-Return ONLY the updated brain content as Markdown. Be concise and organized.
-If there's no new information worth remembering, return the current content unchanged."""
-
-        # Use last N messages for context (avoid token limits)
-        recent_messages = conversation_history[-settings.brain_history_window:]
+        # Use last N messages for context (avoid token limits); skip the
+        # slice copy when the history already fits the window
+        if len(conversation_history) <= settings.brain_history_window:
+            recent_messages = conversation_history
+        else:
+            recent_messages = conversation_history[-settings.brain_history_window:]
 
         # Call Claude to analyze (with retry for transient errors)
         try:
-            message = await _retry_anthropic(
-                lambda: self.client.messages.create(
-                    model=settings.llm_model,
-                    max_tokens=settings.llm_brain_max_tokens,
-                    system=system_prompt,
-                    messages=recent_messages,
-                )
+            message = await self._create_message(
+                model=settings.llm_model,
+                max_tokens=settings.llm_brain_max_tokens,
+                system=system_prompt,
+                messages=recent_messages,
             )
 
             updated_content = message.content[0].text
@@ -171,7 +230,6 @@ If there's no new information worth remembering, return the current content unch
             brain.last_updated_by_conversation_id = conversation_id
 
             await db.commit()
-            await db.refresh(brain)
 
             return updated_content
 
@@ -182,28 +240,26 @@ If there's no new information worth remembering, return the current content unch
 
     async def detect_pattern_update(
         self,
-        conversation_history: list[dict],
+        last_content: str,
+        user_message_count: int,
     ) -> bool:
         """
         Detect if a pattern has emerged that warrants brain update.
 
         Args:
-            conversation_history: List of message dicts
+            last_content: Content of the most recent message
+            user_message_count: Running user-message count for the
+                conversation (stored on ChatConversation, maintained in
+                the message-insert path)
 
         Returns:
             True if brain should be updated, False otherwise
         """
-        if not conversation_history:
+        if not last_content:
             return False
 
-        # Count user messages only
-        user_message_count = sum(1 for msg in conversation_history if msg["role"] == "user")
-
         # Check for explicit memory triggers in last message
-        last_message = conversation_history[-1]["content"].lower()
-        memory_keywords = ["remember", "important", "always", "prefer", "don't forget"]
-
-        if any(keyword in last_message for keyword in memory_keywords):
+        if _MEMORY_TRIGGER_RE.search(last_content):
             return True
 
         # Update every N user messages
@@ -1,45 +1,261 @@
 """Chat service with streaming support and context building."""
 
 import asyncio
+import contextlib
+import io
 import logging
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
 from uuid import UUID
-from anthropic import AsyncAnthropic, APIConnectionError, RateLimitError, APIStatusError
-from sqlalchemy import select
+from anthropic import AsyncAnthropic
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings, sanitize_error
-from app.db.models import PDF, Class, Assignment, Note
+from app.db.models import (
+    PDF,
+    Assignment,
+    BrainMemory,
+    ChatConversation,
+    ChatMessage,
+    Class,
+    Note,
+)
+from app.db.session import AsyncSessionLocal
+from app.services._http import shared_http_client
+from app.services._retry import async_retry
 from app.services.brain_manager import brain_manager
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-def _load_soul() -> str:
-    """Load the SOUL.md persona file for the system prompt."""
-    soul_path = Path(__file__).parent.parent.parent / "SOUL.md"
+_SOUL_PATH = Path(__file__).parent.parent.parent / "SOUL.md"
+
+_SOUL_FALLBACK_BLOCK = {
+    "type": "text",
+    "text": "You are Odin, a strategic academic advisor. Be direct, deadline-aware, and action-oriented.",
+    "cache_control": {"type": "ephemeral"},
+}
+
+
+@lru_cache(maxsize=4)
+def _soul_block(mtime_ns: int) -> dict:
+    """Build the SOUL persona system block for one file revision.
+
+    Keyed by mtime so an edited SOUL.md is picked up without a restart,
+    while unchanged calls cost one stat instead of a read + decode. The
+    same dict is returned until the file changes, keeping the block
+    byte-identical across calls so Anthropic's prompt cache can reuse
+    the prefix; cache_control marks the cache breakpoint.
+    """
+    return {
+        "type": "text",
+        "text": _SOUL_PATH.read_text(encoding="utf-8"),
+        "cache_control": {"type": "ephemeral"},
+    }
+
+
+def _get_soul_block() -> dict:
+    """Return the current SOUL system block, falling back if the file is missing."""
     try:
-        return soul_path.read_text(encoding="utf-8")
+        return _soul_block(_SOUL_PATH.stat().st_mtime_ns)
     except FileNotFoundError:
-        logger.warning("SOUL.md not found at %s, using fallback persona", soul_path)
-        return "You are Odin, a strategic academic advisor. Be direct, deadline-aware, and action-oriented."
+        logger.warning("SOUL.md not found at %s, using fallback persona", _SOUL_PATH)
+        return _SOUL_FALLBACK_BLOCK
+
+
+def _build_system(context: str) -> list[dict]:
+    """Two-block system prompt: cached SOUL persona + per-request context."""
+    return [
+        _get_soul_block(),
+        {
+            "type": "text",
+            "text": (
+                "## Active Context\n\n"
+                f"{context}\n\n"
+                "---\n\n"
+                "Use the active context above to ground your responses. "
+                "Reference specific materials, deadlines, and assignments when relevant."
+            ),
+        },
+    ]
+
+
+def _build_messages(conversation_history: list[dict], user_message: str) -> list[dict]:
+    """Append the new user turn and mark the history tail as cacheable.
+
+    The cache_control on the last history message lets the server reuse
+    the conversation prefix on the next turn. The marked message is a
+    copy - the caller's history dicts are never mutated.
+    """
+    messages = conversation_history + [{"role": "user", "content": user_message}]
+    if conversation_history:
+        last = conversation_history[-1]
+        messages[len(conversation_history) - 1] = {
+            "role": last["role"],
+            "content": [
+                {
+                    "type": "text",
+                    "text": last["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+    return messages
+
+
+async def _fetch_scalars(stmt) -> list:
+    """Run a read-only select on its own pool session.
+
+    AsyncSession is not safe for concurrent use, so each gathered fetch
+    checks out its own session instead of sharing the request session.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+
+async def _fetch_rows(stmt) -> list:
+    """Like _fetch_scalars, but for column selects that need whole rows."""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        return list(result.all())
+
+
+async def _no_rows() -> list:
+    """Placeholder awaitable for fetches skipped in the gather."""
+    return []
+
+
+# How long yielded stream chunks may accumulate before being flushed
+_STREAM_COALESCE_SECONDS = 0.015
+
+
+async def _coalesce_stream(source, interval: float = _STREAM_COALESCE_SECONDS):
+    """Batch chunks from an async text stream over a short window.
+
+    At high token rates a yield (and the SSE frame behind it) per API
+    chunk dominates; a pump task drains the source while the generator
+    flushes the accumulated text every `interval`. Imperceptible to the
+    reader, but cuts frames and scheduler hops to a fraction. Errors
+    from the source surface after buffered text is flushed, and closing
+    the generator cancels the pump (which unwinds the source stream).
+    """
+    buf: list[str] = []
+    ready = asyncio.Event()
+    done = False
+
+    async def pump():
+        nonlocal done
+        try:
+            async for chunk in source:
+                buf.append(chunk)
+                ready.set()
+        finally:
+            done = True
+            ready.set()
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            await ready.wait()
+            if buf:
+                # Let more chunks land before flushing
+                await asyncio.sleep(interval)
+            ready.clear()
+            if buf:
+                text = "".join(buf)
+                buf.clear()
+                yield text
+            if done and not buf:
+                break
+        await task  # Surface any pump error
+    finally:
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
 
 
-# Load once at module import
-_SOUL_PROMPT = _load_soul()
+# Instructions for folding aged-out chat turns into the rolling summary
+_HISTORY_SUMMARY_SYSTEM = (
+    "You summarize the earlier portion of a conversation between a student "
+    "and their academic advisor. Fold the prior summary (if any) and the new "
+    "messages into one concise summary that preserves facts, decisions, "
+    "deadlines, and stated preferences. Return only the summary text."
+)
 
-# Transient error types that warrant retrying
-_RETRYABLE_ERRORS = (APIConnectionError, RateLimitError)
+
+# Rendered context packs keyed by (user_id, sorted id tuples, version
+# stamp). The stamp is the newest updated_at across the rows in scope, so
+# a stale entry can never be served - any write bumps the stamp and the
+# lookup simply misses. Plain dict in insertion order doubles as an LRU:
+# hits are re-inserted, eviction pops the oldest entry
+_CONTEXT_CACHE: dict[tuple, str] = {}
+_CONTEXT_CACHE_MAX = 512
 
 
 class ChatService:
     """Service for handling LLM chat with context from brains and PDFs."""
 
     def __init__(self):
-        """Initialize Anthropic client."""
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        """Initialize Anthropic client on the shared HTTP/2 pool."""
+        self.client = AsyncAnthropic(
+            api_key=settings.anthropic_api_key, http_client=shared_http_client
+        )
+
+    async def _context_stamp(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        class_ids: list[UUID],
+        assignment_ids: list[UUID],
+        pdf_ids: list[UUID],
+        note_ids: list[UUID] | None,
+    ):
+        """
+        Compute a version stamp for the context inputs in one query.
+
+        Takes GREATEST of max(updated_at) across the user's brains and the
+        referenced classes, assignments, PDFs, and notes (Postgres GREATEST
+        ignores NULL operands). Any write to a row in scope changes the
+        stamp, which invalidates cached context packs keyed on it.
+        """
+        parts = [
+            select(func.max(BrainMemory.updated_at))
+            .where(BrainMemory.user_id == user_id)
+            .scalar_subquery()
+        ]
+        if class_ids:
+            parts.append(
+                select(func.max(Class.updated_at))
+                .where(Class.id.in_(class_ids), Class.user_id == user_id)
+                .scalar_subquery()
+            )
+        if assignment_ids:
+            parts.append(
+                select(func.max(Assignment.updated_at))
+                .where(Assignment.id.in_(assignment_ids), Assignment.user_id == user_id)
+                .scalar_subquery()
+            )
+        if pdf_ids:
+            parts.append(
+                select(func.max(PDF.updated_at))
+                .where(PDF.id.in_(pdf_ids), PDF.user_id == user_id)
+                .scalar_subquery()
+            )
+        if note_ids:
+            parts.append(
+                select(func.max(Note.updated_at))
+                .where(Note.id.in_(note_ids), Note.user_id == user_id)
+                .scalar_subquery()
+            )
+
+        stamp_expr = parts[0] if len(parts) == 1 else func.greatest(*parts)
+        result = await db.execute(select(stamp_expr))
+        return result.scalar_one_or_none()
 
     async def build_context(
         self,
@@ -64,7 +280,74 @@ class ChatService:
         Returns:
             Combined context string as markdown
         """
-        context_parts = []
+        # Cheap version-stamp query first: on repeat turns with unchanged
+        # inputs (the common case in a chat loop) the rendered pack is
+        # served from cache, skipping the remaining round trips. The cached
+        # string is also byte-identical across turns, which keeps the
+        # dynamic system block stable for prompt caching
+        stamp = await self._context_stamp(
+            db, user_id, class_ids, assignment_ids, pdf_ids, note_ids
+        )
+        cache_key = (
+            user_id,
+            tuple(sorted(class_ids)),
+            tuple(sorted(assignment_ids)),
+            tuple(sorted(pdf_ids)),
+            tuple(sorted(note_ids or [])),
+            stamp,
+        )
+        cached = _CONTEXT_CACHE.pop(cache_key, None)
+        if cached is not None:
+            _CONTEXT_CACHE[cache_key] = cached  # Re-insert = LRU touch
+            return cached
+
+        # The four sections are independent and I/O-bound, so fetch them
+        # concurrently: wall-clock drops from sum-of-round-trips to the
+        # slowest one. The brain/class section stays on the request session
+        # (brain lookups may insert rows); the read-only fetches each run on
+        # their own pool session. Assembly below is sequential, so output
+        # order stays deterministic
+        brain_sections, assignments, pdfs, notes = await asyncio.gather(
+            self._collect_brain_sections(db, user_id, class_ids),
+            _fetch_scalars(
+                select(Assignment).where(
+                    Assignment.id.in_(assignment_ids), Assignment.user_id == user_id
+                )
+            )
+            if assignment_ids
+            else _no_rows(),
+            # Truncate in SQL: only the head of each document crosses the
+            # wire, not megabytes of text that would be sliced away in
+            # Python anyway
+            _fetch_rows(
+                select(
+                    PDF.filename,
+                    func.substr(PDF.extracted_text, 1, settings.pdf_context_max_chars).label(
+                        "head"
+                    ),
+                    func.length(PDF.extracted_text).label("full_len"),
+                ).where(PDF.id.in_(pdf_ids), PDF.user_id == user_id)
+            )
+            if pdf_ids
+            else _no_rows(),
+            _fetch_rows(
+                select(
+                    Note.title,
+                    func.substr(Note.content_text, 1, settings.note_context_max_chars).label(
+                        "head"
+                    ),
+                    func.length(Note.content_text).label("full_len"),
+                ).where(Note.id.in_(note_ids), Note.user_id == user_id)
+            )
+            if note_ids
+            else _no_rows(),
+        )
+
+        # Write parts straight into one buffer rather than collecting a
+        # list and joining: the intermediate list of fragments and the
+        # join's second full-size copy never exist, which matters when the
+        # parts include tens-of-KB PDF extracts
+        buf = io.StringIO()
         total_chars = 0
         max_total = settings.max_total_context_chars
 
@@ -73,92 +356,191 @@ class ChatService:
             nonlocal total_chars
             if total_chars + len(part) > max_total:
                 return False
-            context_parts.append(part)
+            if total_chars:
+                buf.write("\n\n")
+            buf.write(part)
             total_chars += len(part)
             return True
 
-        # 1. Load global brain
-        global_brain = await brain_manager.get_or_create_brain(db, user_id, None)
-        if global_brain.content:
-            _add_part(f"# Global Knowledge\n{global_brain.content}\n")
+        # 1. Global brain, class headers, and class brains
+        for part in brain_sections:
+            if total_chars >= max_total:
+                break
+            _add_part(part)
+
+        # 2. Assignment metadata
+        if assignments and total_chars < max_total:
+            assignment_parts = ["# Assignments in Context\n"]
+            for assignment in assignments:
+                assignment_parts.append(
+                    f"- **{assignment.title}** (Due: {assignment.due_date or 'No due date'})"
+                )
+                if assignment.notes_short:
+                    assignment_parts.append(f"  - Notes: {assignment.notes_short}")
+            assignment_parts.append("\n")
+            _add_part("\n".join(assignment_parts))
 
-        # 2. Load class brains and metadata
-        for class_id in class_ids:
+        # 3. PDF content (already truncated server-side)
+        for pdf in pdfs:
             if total_chars >= max_total:
                 break
+            if pdf.head:
+                pdf_text = pdf.head
+                if pdf.full_len > settings.pdf_context_max_chars:
+                    pdf_text += "\n\n[... content truncated ...]"
+                _add_part(f"# Document: {pdf.filename}\n{pdf_text}\n")
+
+        # 4. Note content (already truncated server-side)
+        for note in notes:
+            if total_chars >= max_total:
+                break
+            if note.head:
+                note_text = note.head
+                if note.full_len > settings.note_context_max_chars:
+                    note_text += "\n\n[... content truncated ...]"
+                _add_part(f"# Note: {note.title}\n{note_text}\n")
+
+        if total_chars >= max_total:
+            buf.write("\n\n\n\n[... additional context omitted due to size limits ...]")
+
+        context = buf.getvalue() or "No context available."
 
-            # Get class info
-            stmt = select(Class).where(Class.id == class_id, Class.user_id == user_id)
-            result = await db.execute(stmt)
-            class_obj = result.scalar_one_or_none()
+        if len(_CONTEXT_CACHE) >= _CONTEXT_CACHE_MAX:
+            _CONTEXT_CACHE.pop(next(iter(_CONTEXT_CACHE)))
+        _CONTEXT_CACHE[cache_key] = context
 
+        return context
+
+    async def _collect_brain_sections(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        class_ids: list[UUID],
+    ) -> list[str]:
+        """
+        Render the global-brain and per-class context sections.
+
+        Runs on the caller's session because brain lookups may insert
+        missing rows; the read-only fetches in build_context run
+        concurrently on their own sessions.
+        """
+        parts: list[str] = []
+
+        global_brain = await brain_manager.get_or_create_brain(db, user_id, None)
+        if global_brain.content:
+            parts.append(f"# Global Knowledge\n{global_brain.content}\n")
+
+        if not class_ids:
+            return parts
+
+        # One IN query each for class metadata and class brains instead of
+        # a SELECT (and potential INSERT) per class
+        result = await db.execute(
+            select(Class).where(Class.id.in_(class_ids), Class.user_id == user_id)
+        )
+        classes = {class_obj.id: class_obj for class_obj in result.scalars()}
+        brains = await brain_manager.get_or_create_brains_bulk(db, user_id, class_ids)
+
+        for class_id in class_ids:
+            class_obj = classes.get(class_id)
             if class_obj:
                 header = f"# Class: {class_obj.name}"
                 if class_obj.code:
                     header += f" ({class_obj.code})"
                 header += "\n"
-                _add_part(header)
+                parts.append(header)
 
-            # Get class brain
-            class_brain = await brain_manager.get_or_create_brain(db, user_id, class_id)
-            if class_brain.content:
-                _add_part(f"## Class Brain\n{class_brain.content}\n")
+            class_brain = brains.get(class_id)
+            if class_brain and class_brain.content:
+                parts.append(f"## Class Brain\n{class_brain.content}\n")
 
-        # 3. Load assignment metadata
-        if assignment_ids and total_chars < max_total:
-            stmt = select(Assignment).where(
-                Assignment.id.in_(assignment_ids), Assignment.user_id == user_id
-            )
-            result = await db.execute(stmt)
-            assignments = result.scalars().all()
-
-            if assignments:
-                assignment_parts = ["# Assignments in Context\n"]
-                for assignment in assignments:
-                    assignment_parts.append(
-                        f"- **{assignment.title}** (Due: {assignment.due_date or 'No due date'})"
-                    )
-                    if assignment.notes_short:
-                        assignment_parts.append(f"  - Notes: {assignment.notes_short}")
-                assignment_parts.append("\n")
-                _add_part("\n".join(assignment_parts))
-
-        # 4. Load PDF content
-        if pdf_ids and total_chars < max_total:
-            stmt = select(PDF).where(PDF.id.in_(pdf_ids), PDF.user_id == user_id)
-            result = await db.execute(stmt)
-            pdfs = result.scalars().all()
-
-            for pdf in pdfs:
-                if total_chars >= max_total:
-                    break
-                if pdf.extracted_text:
-                    # Limit individual PDF content
-                    pdf_text = pdf.extracted_text[:settings.pdf_context_max_chars]
-                    if len(pdf.extracted_text) > settings.pdf_context_max_chars:
-                        pdf_text += "\n\n[... content truncated ...]"
-                    _add_part(f"# Document: {pdf.filename}\n{pdf_text}\n")
-
-        # 5. Load note content
-        if note_ids and total_chars < max_total:
-            stmt = select(Note).where(Note.id.in_(note_ids), Note.user_id == user_id)
-            result = await db.execute(stmt)
-            notes = result.scalars().all()
-
-            for note in notes:
-                if total_chars >= max_total:
-                    break
-                if note.content_text:
-                    # Limit individual note content
-                    note_text = note.content_text[:settings.note_context_max_chars]
-                    if len(note.content_text) > settings.note_context_max_chars:
-                        note_text += "\n\n[... content truncated ...]"
-                    _add_part(f"# Note: {note.title}\n{note_text}\n")
+        return parts
 
-        if total_chars >= max_total:
-            context_parts.append("\n\n[... additional context omitted due to size limits ...]")
+    def apply_history_window(
+        self, conversation: ChatConversation, history: list[dict]
+    ) -> list[dict]:
+        """
+        Replace summarized leading messages with the stored summary block.
 
-        return "\n\n".join(context_parts) if context_parts else "No context available."
+        Without this, every turn re-sends the full conversation, so input
+        tokens grow linearly per turn and cost quadratically per session.
+        The summary text only changes when refresh_history_summary runs,
+        so between refreshes the replaced prefix is byte-identical across
+        turns and stays inside the cacheable prompt prefix.
+        """
+        summary = conversation.history_summary
+        count = conversation.history_summary_count
+        if not summary or count <= 0 or count > len(history):
+            return history
+        return [
+            {"role": "user", "content": f"[Previous context: {summary}]"},
+            {"role": "assistant", "content": "Understood."},
+            *history[count:],
+        ]
+
+    def history_summary_due(
+        self, conversation: ChatConversation, history_len: int
+    ) -> bool:
+        """True when enough messages have aged past the window to warrant a refresh."""
+        window = settings.chat_history_window_messages
+        threshold = settings.chat_history_summary_threshold
+        if history_len <= threshold:
+            return False
+        batch = max(threshold - window, 2)
+        old_count = history_len - window
+        old_count -= old_count % 2  # Keep user/assistant pairs intact
+        return old_count - conversation.history_summary_count >= batch
+
+    async def refresh_history_summary(self, conversation_id: UUID) -> None:
+        """
+        Fold newly aged-out messages into the conversation's rolling summary.
+
+        Runs as a background task on its own session, so the active turn
+        still sees the previous summary; the refreshed one applies from
+        the next turn on. Failures are logged and leave the stored
+        summary untouched.
+        """
+        window = settings.chat_history_window_messages
+        try:
+            async with AsyncSessionLocal() as db:
+                conversation = await db.get(ChatConversation, conversation_id)
+                if conversation is None:
+                    return
+
+                result = await db.execute(
+                    select(ChatMessage)
+                    .where(ChatMessage.conversation_id == conversation_id)
+                    .order_by(ChatMessage.created_at.asc())
+                )
+                messages = result.scalars().all()
+
+                old_count = len(messages) - window
+                old_count -= old_count % 2  # Keep user/assistant pairs intact
+                if old_count <= conversation.history_summary_count:
+                    return
+
+                aged = messages[conversation.history_summary_count : old_count]
+                transcript = "\n\n".join(f"{m.role}: {m.content}" for m in aged)
+
+                prompt_parts = []
+                if conversation.history_summary:
+                    prompt_parts.append(f"Prior summary:\n{conversation.history_summary}")
+                prompt_parts.append(f"New messages:\n{transcript}")
+
+                message = await self._create_message(
+                    model=settings.llm_summary_model,
+                    max_tokens=settings.llm_summary_max_tokens,
+                    system=_HISTORY_SUMMARY_SYSTEM,
+                    messages=[{"role": "user", "content": "\n\n".join(prompt_parts)}],
+                )
+
+                conversation.history_summary = message.content[0].text
+                conversation.history_summary_count = old_count
+                await db.commit()
+        except Exception:
+            logger.exception(
+                "History summary refresh failed for conversation %s", conversation_id
+            )
 
     async def stream_response(
         self,
@@ -178,56 +560,40 @@ class ChatService:
             Text chunks from Claude's streaming response
         """
         # Build system prompt from SOUL.md persona + injected context
-        system_prompt = f"""{_SOUL_PROMPT}
-
----
-
-## Active Context
-
-{context}
-
----
-
-Use the active context above to ground your responses. Reference specific materials, deadlines, and assignments when relevant."""
+        system_prompt = _build_system(context)
 
         # Build messages list
-        messages = conversation_history + [{"role": "user", "content": user_message}]
-
-        # Stream response from Claude (with retry for transient connection errors)
-        max_attempts = 3
-        last_error = None
-
-        for attempt in range(max_attempts):
-            try:
-                async with self.client.messages.stream(
-                    model=settings.llm_model,
-                    max_tokens=settings.llm_max_tokens,
-                    system=system_prompt,
-                    messages=messages,
-                ) as stream:
-                    async for text in stream.text_stream:
-                        yield text
-                return  # Success, exit the retry loop
-
-            except _RETRYABLE_ERRORS as e:
-                last_error = e
-                if attempt < max_attempts - 1:
-                    delay = 1.0 * (2 ** attempt)
-                    logger.warning(
-                        "Anthropic stream transient error (attempt %d/%d), retrying in %.1fs: %s",
-                        attempt + 1, max_attempts, delay, str(e),
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.exception("LLM streaming failed after %d attempts", max_attempts)
-                    safe_msg = sanitize_error(e, generic_message="An error occurred while generating the response.")
-                    yield f"\n\n[Error: {safe_msg}]"
-
-            except Exception as e:
-                logger.exception("Error during LLM streaming response")
-                safe_msg = sanitize_error(e, generic_message="An error occurred while generating the response.")
-                yield f"\n\n[Error: {safe_msg}]"
-                return  # Non-retryable error
+        messages = _build_messages(conversation_history, user_message)
+
+        # Stream response from Claude; transient errors before the first
+        # chunk are retried inside _stream_text, and chunks are coalesced
+        # into ~15ms flushes before crossing the SSE boundary
+        try:
+            source = self._stream_text(
+                model=settings.llm_model,
+                max_tokens=settings.llm_max_tokens,
+                system=system_prompt,
+                messages=messages,
+            )
+            async for text in _coalesce_stream(source):
+                yield text
+
+        except Exception as e:
+            logger.exception("Error during LLM streaming response")
+            safe_msg = sanitize_error(e, generic_message="An error occurred while generating the response.")
+            yield f"\n\n[Error: {safe_msg}]"
+
+    @async_retry()
+    async def _stream_text(self, **kwargs):
+        """Stream text chunks from the Anthropic API with shared retry policy."""
+        async with self.client.messages.stream(**kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+    @async_retry()
+    async def _create_message(self, **kwargs):
+        """Call the Anthropic messages API with shared retry policy."""
+        return await self.client.messages.create(**kwargs)
 
     async def get_full_response(
         self,
@@ -246,55 +612,23 @@ Use the active context above to ground your responses. Reference specific materi
         Returns:
             Full response text
         """
-        system_prompt = f"""{_SOUL_PROMPT}
-
----
-
-## Active Context
-
-{context}
+        system_prompt = _build_system(context)
 
----
+        messages = _build_messages(conversation_history, user_message)
 
-Use the active context above to ground your responses. Reference specific materials, deadlines, and assignments when relevant."""
-
-        messages = conversation_history + [{"role": "user", "content": user_message}]
-
-        max_attempts = 3
-        last_error = None
+        try:
+            message = await self._create_message(
+                model=settings.llm_model,
+                max_tokens=settings.llm_max_tokens,
+                system=system_prompt,
+                messages=messages,
+            )
+            return message.content[0].text
 
-        for attempt in range(max_attempts):
-            try:
-                message = await self.client.messages.create(
-                    model=settings.llm_model,
-                    max_tokens=settings.llm_max_tokens,
-                    system=system_prompt,
-                    messages=messages,
-                )
-                return message.content[0].text
-
-            except _RETRYABLE_ERRORS as e:
-                last_error = e
-                if attempt < max_attempts - 1:
-                    delay = 1.0 * (2 ** attempt)
-                    logger.warning(
-                        "Anthropic API transient error (attempt %d/%d), retrying in %.1fs: %s",
-                        attempt + 1, max_attempts, delay, str(e),
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.exception("LLM full response failed after %d attempts", max_attempts)
-                    safe_msg = sanitize_error(e, generic_message="An error occurred while generating the response.")
-                    return f"Error: {safe_msg}"
-
-            except Exception as e:
-                logger.exception("Error during LLM full response")
-                safe_msg = sanitize_error(e, generic_message="An error occurred while generating the response.")
-                return f"Error: {safe_msg}"
-
-        # Should not reach here, but just in case
-        safe_msg = sanitize_error(last_error, generic_message="An error occurred while generating the response.")
-        return f"Error: {safe_msg}"
+        except Exception as e:
+            logger.exception("Error during LLM full response")
+            safe_msg = sanitize_error(e, generic_message="An error occurred while generating the response.")
+            return f"Error: {safe_msg}"
 
 
 # Singleton instance
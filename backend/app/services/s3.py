@@ -1,34 +1,194 @@
 """S3 service for PDF storage and retrieval."""
 
+import asyncio
+import copy
+import gzip
+import io
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore import signers as botocore_signers
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.config import get_settings
 
 settings = get_settings()
 
+# Objects past the threshold move as concurrent 8 MiB ranged parts
+# (multipart PUT / ranged GET) instead of one TCP stream, the same
+# scheme the AWS CLI uses for throughput. max_concurrency must stay
+# within s3_max_pool_connections so parts don't queue on the pool
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+    # With the crt extra installed (awscrt), transfers that qualify run
+    # on the AWS Common Runtime - native TLS and HTTP instead of
+    # urllib3-in-Python; without it this resolves to the classic client
+    preferred_transfer_client="auto",
+)
+
+# Existence-check results cached per key with a short TTL: repeat
+# lookups for the same PDF skip the head_object round trip. Writes
+# through this service invalidate the key; uploads that bypass it
+# (presigned POSTs) are bounded by the TTL
+_EXISTS_CACHE: dict[str, tuple[float, bool]] = {}
+_EXISTS_CACHE_MAX = 4096
+_EXISTS_CACHE_TTL = 60.0
+
+# Presigned POSTs are deterministic for a given key/type/expiry apart
+# from their signing timestamp, so repeats within a window far shorter
+# than the URL's validity can reuse the signature (4x HMAC-SHA256 per
+# miss) instead of recomputing it
+_PRESIGN_CACHE: dict[tuple[str, str, int], tuple[float, dict]] = {}
+_PRESIGN_CACHE_MAX = 1024
+_PRESIGN_CACHE_TTL = 30.0
+
+
+def _build_client_settings() -> tuple[dict, Config]:
+    """Derive the S3 client kwargs and Config once for the process.
+
+    Settings are fixed for the process lifetime and pydantic attribute
+    access is descriptor-wrapped, so this runs once at import instead
+    of per client (thread-local clients build one per worker thread).
+    """
+    client_kwargs = {
+        "aws_access_key_id": settings.aws_access_key_id,
+        "aws_secret_access_key": settings.aws_secret_access_key,
+        "region_name": settings.aws_s3_region,
+    }
+    # Acceleration/dualstack endpoints are derived by botocore from
+    # these options; an explicit endpoint_url would override them,
+    # so the regional endpoint is only pinned when neither is on.
+    # Acceleration requires virtual-hosted addressing
+    s3_options: dict = {}
+    if settings.aws_s3_use_accelerate:
+        s3_options["use_accelerate_endpoint"] = True
+        s3_options["addressing_style"] = "virtual"
+    if settings.aws_s3_use_dualstack:
+        s3_options["use_dualstack_endpoint"] = True
+
+    # Support MinIO / LocalStack by pointing to a custom endpoint.
+    # For real S3, use the regional endpoint to avoid 307 redirects
+    # that break browser CORS on presigned uploads.
+    if settings.aws_s3_endpoint_url:
+        client_kwargs["endpoint_url"] = settings.aws_s3_endpoint_url
+    elif not s3_options:
+        client_kwargs["endpoint_url"] = f"https://s3.{settings.aws_s3_region}.amazonaws.com"
+
+    # botocore defaults to a 10-connection pool, which throttles
+    # concurrent requests ("Connection pool is full, discarding
+    # connection") and pays a fresh TCP+TLS handshake per overflow.
+    # A larger keep-alive pool with bounded timeouts amortizes setup
+    # across requests and fails fast on a wedged endpoint
+    client_config = Config(
+        max_pool_connections=settings.s3_max_pool_connections,
+        retries={"mode": "standard", "max_attempts": 3},
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=30,
+        s3=s3_options or None,
+    )
+    return client_kwargs, client_config
+
+
+_CLIENT_KWARGS, _CLIENT_CONFIG = _build_client_settings()
+
 
 class S3Service:
-    """Service for interacting with AWS S3 for brain storage."""
+    """Service for interacting with AWS S3 for brain storage.
 
-    def __init__(self):
-        """Initialize S3 client with credentials from settings."""
-        client_kwargs = {
-            "aws_access_key_id": settings.aws_access_key_id,
-            "aws_secret_access_key": settings.aws_secret_access_key,
-            "region_name": settings.aws_s3_region,
-        }
-        # Support MinIO / LocalStack by pointing to a custom endpoint.
-        # For real S3, use the regional endpoint to avoid 307 redirects
-        # that break browser CORS on presigned uploads.
-        if settings.aws_s3_endpoint_url:
-            client_kwargs["endpoint_url"] = settings.aws_s3_endpoint_url
-        else:
-            client_kwargs["endpoint_url"] = f"https://s3.{settings.aws_s3_region}.amazonaws.com"
+    boto3 is synchronous, so the async methods offload their network
+    calls to worker threads via asyncio.to_thread - run inline they
+    would block the event loop for the full S3 round trip. Each worker
+    thread gets its own boto3 client via _client().
+    """
 
-        self.s3_client = boto3.client("s3", **client_kwargs)
+    def __init__(self):
+        """Initialize with the precomputed client settings."""
+        self._client_kwargs = _CLIENT_KWARGS
+        self._client_config = _CLIENT_CONFIG
+        self._local = threading.local()
         self.bucket = settings.aws_s3_bucket
 
+    def _client(self):
+        """Return this thread's S3 client, creating it on first use.
+
+        S3 calls run on asyncio.to_thread worker threads; sharing one
+        client across them contends on its internal locks and single
+        urllib3 pool. A client per thread removes that contention and
+        gives each worker its own connection pool. Clients are built
+        from a fresh Session because boto3's default session is not
+        safe for concurrent client creation.
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = boto3.session.Session().client(
+                "s3", **self._client_kwargs, config=self._client_config
+            )
+            self._local.client = client
+        return client
+
+    def _presign_state(self):
+        """Return (presigner, request_dict) for this thread's client.
+
+        Everything in generate_presigned_post except the policy and
+        signature - endpoint ruleset resolution, parameter emission,
+        the request dict - depends only on the bucket, so it is
+        computed once per thread and replayed per call. This mirrors
+        botocore's own implementation and leans on private client
+        methods; if those move in a botocore upgrade, callers fall
+        back to the public wrapper (state is None).
+        """
+        state = getattr(self._local, "presign_state", None)
+        if state is None:
+            client = self._client()
+            try:
+                context = {
+                    "is_presign_request": True,
+                    "use_global_endpoint": (
+                        botocore_signers._should_use_global_endpoint(client)
+                    ),
+                }
+                operation_model = client.meta.service_model.operation_model(
+                    "CreateBucket"
+                )
+                params = client._emit_api_params(
+                    api_params={"Bucket": self.bucket},
+                    operation_model=operation_model,
+                    context=context,
+                )
+                endpoint_url, additional_headers, _ = client._resolve_endpoint_ruleset(
+                    operation_model,
+                    params,
+                    context,
+                    ignore_signing_region=True,
+                )
+                request_dict = client._convert_to_request_dict(
+                    api_params=params,
+                    operation_model=operation_model,
+                    endpoint_url=endpoint_url,
+                    context=context,
+                    headers=additional_headers,
+                    set_user_agent_header=False,
+                )
+                state = (
+                    botocore_signers.S3PostPresigner(client._request_signer),
+                    request_dict,
+                )
+            except Exception:
+                state = False
+            self._local.presign_state = state
+        return state or None
+
     async def generate_presigned_upload_url(
         self,
         file_key: str,
@@ -49,20 +209,58 @@ class S3Service:
         Raises:
             ClientError: If S3 operation fails
         """
+        # The client may create the object through this URL without
+        # touching this service, so drop any stale negative entry
+        _EXISTS_CACHE.pop(file_key, None)
+
+        cache_key = (file_key, content_type, expiration)
+        cached = _PRESIGN_CACHE.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
-            return self.s3_client.generate_presigned_post(
-                self.bucket,
-                file_key,
-                Fields={"Content-Type": content_type},
-                Conditions=[
-                    {"Content-Type": content_type},
-                    ["content-length-range", 1, settings.max_pdf_size_bytes],
-                ],
-                ExpiresIn=expiration,
-            )
+            # Presigning is local HMAC computation - no network round
+            # trip - so it stays inline rather than on a worker thread.
+            # The precomputed per-thread state skips botocore's
+            # endpoint/parameter machinery, leaving just the policy
+            # build and signature per call
+            state = self._presign_state()
+            if state is not None:
+                presigner, request_dict = state
+                fields = {"Content-Type": content_type, "key": file_key}
+                presigned = presigner.generate_presigned_post(
+                    request_dict=copy.deepcopy(request_dict),
+                    fields=fields,
+                    conditions=[
+                        {"Content-Type": content_type},
+                        ["content-length-range", 1, settings.max_pdf_size_bytes],
+                        {"bucket": self.bucket},
+                        {"key": file_key},
+                    ],
+                    expires_in=expiration,
+                )
+            else:
+                presigned = self._client().generate_presigned_post(
+                    self.bucket,
+                    file_key,
+                    Fields={"Content-Type": content_type},
+                    Conditions=[
+                        {"Content-Type": content_type},
+                        ["content-length-range", 1, settings.max_pdf_size_bytes],
+                    ],
+                    ExpiresIn=expiration,
+                )
         except ClientError as e:
             raise Exception(f"Failed to generate presigned URL: {str(e)}") from e
 
+        # TTL stays well under the URL's validity so a cached hit still
+        # leaves the client most of the expiration window to upload
+        ttl = min(_PRESIGN_CACHE_TTL, expiration / 4)
+        if len(_PRESIGN_CACHE) >= _PRESIGN_CACHE_MAX:
+            _PRESIGN_CACHE.pop(next(iter(_PRESIGN_CACHE)))
+        _PRESIGN_CACHE[cache_key] = (time.monotonic() + ttl, presigned)
+        return presigned
+
     async def download_pdf(self, file_key: str) -> bytes:
         """
         Download PDF from S3.
@@ -76,9 +274,44 @@ class S3Service:
         Raises:
             ClientError: If S3 operation fails
         """
+        def _get() -> bytes:
+            # The body read streams over the same connection, so it
+            # belongs on the worker thread with the request itself.
+            # ContentLength lets us preallocate the buffer and fill it
+            # in 1 MiB chunks, so memory stays flat instead of the
+            # repeated grow-and-copy of accumulating into one read()
+            response = self._client().get_object(Bucket=self.bucket, Key=file_key)
+            body = response["Body"]
+            length = response.get("ContentLength")
+            if not length:
+                data = body.read()
+            elif length > _TRANSFER_CONFIG.multipart_threshold:
+                # Refetch large objects as parallel ranged GETs; the
+                # probe stream is abandoned before any body bytes move
+                body.close()
+                sink = io.BytesIO()
+                self._client().download_fileobj(
+                    self.bucket, file_key, sink, Config=_TRANSFER_CONFIG
+                )
+                data = sink.getvalue()
+            else:
+                buf = bytearray(length)
+                view = memoryview(buf)
+                offset = 0
+                for chunk in body.iter_chunks(chunk_size=1 << 20):
+                    view[offset : offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                # Defensive: a short read should not hand
+                # truncated-looking data padded with NULs to the parser
+                data = bytes(view[:offset]) if offset != length else bytes(buf)
+            if response.get("ContentEncoding") == "gzip":
+                # Objects written by upload_pdf's compressible path;
+                # presigned client uploads never carry this encoding
+                data = gzip.decompress(data)
+            return data
+
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=file_key)
-            return response["Body"].read()
+            return await asyncio.to_thread(_get)
         except ClientError as e:
             raise Exception(f"Failed to download PDF from S3: {str(e)}") from e
 
@@ -92,47 +325,198 @@ class S3Service:
         Raises:
             ClientError: If S3 operation fails
         """
+        _EXISTS_CACHE.pop(file_key, None)
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=file_key)
+            await asyncio.to_thread(
+                self._client().delete_object, Bucket=self.bucket, Key=file_key
+            )
         except ClientError as e:
             raise Exception(f"Failed to delete PDF from S3: {str(e)}") from e
 
-    async def upload_pdf(self, file_key: str, file_data: bytes) -> None:
+    @staticmethod
+    def _compressible(data: bytes | bytearray | memoryview) -> bool:
+        """Probe whether gzipping the payload is worth the CPU.
+
+        Deflates the first 4KB at level 1; already-compressed PDF
+        streams barely shrink, so anything that stays above 85% of its
+        size is uploaded as-is.
+        """
+        probe = bytes(data[:4096])
+        if not probe:
+            return False
+        return len(zlib.compress(probe, 1)) / len(probe) < 0.85
+
+    async def upload_pdf(self, file_key: str, file_data: BinaryIO | bytes) -> None:
         """
         Upload PDF directly to S3 (server-side upload).
 
+        Passing a file object (e.g. UploadFile.file) lets boto3 pull
+        8 MiB chunks from it instead of the whole PDF living in memory
+        at once. Raw bytes still work: the BytesIO wrapper shares the
+        buffer copy-on-write, so no duplicate is made for a read-only
+        upload.
+
         Args:
             file_key: S3 object key (path) for the file
-            file_data: Raw bytes of the PDF file
+            file_data: Binary file object or raw bytes of the PDF file
 
         Raises:
             ClientError: If S3 operation fails
         """
+        _EXISTS_CACHE.pop(file_key, None)
+        # CRC32C integrity checksum: with the crt extra it runs on the
+        # SSE4.2 CRC32 instruction (~GB/s vs MD5's hundreds of MB/s),
+        # and S3 validates it in hardware on its side too
+        extra_args = {"ContentType": "application/pdf", "ChecksumAlgorithm": "CRC32C"}
+        if isinstance(file_data, (bytes, bytearray, memoryview)):
+            if settings.s3_gzip_uploads and self._compressible(file_data):
+                # Most PDFs hold already-deflated streams, but scanned
+                # or uncompressed ones shrink enough that fewer wire
+                # bytes beat the level-1 gzip cost. download_pdf
+                # reverses this via the ContentEncoding header
+                file_data = gzip.compress(bytes(file_data), compresslevel=1)
+                extra_args["ContentEncoding"] = "gzip"
+            file_data = io.BytesIO(file_data)
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket,
-                Key=file_key,
-                Body=file_data,
-                ContentType="application/pdf",
+            # upload_fileobj does a single PUT below the multipart
+            # threshold and concurrent multipart parts above it
+            await asyncio.to_thread(
+                self._client().upload_fileobj,
+                file_data,
+                self.bucket,
+                file_key,
+                ExtraArgs=extra_args,
+                Config=_TRANSFER_CONFIG,
             )
         except ClientError as e:
             raise Exception(f"Failed to upload PDF to S3: {str(e)}") from e
 
+    async def upload_pdf_if_absent(self, file_key: str, file_data: BinaryIO | bytes) -> bool:
+        """
+        Upload the PDF unless the key already exists, in one round trip.
+
+        Uses a conditional put (If-None-Match: *) so existence check
+        and write are a single request - callers should use this
+        instead of pairing check_file_exists with upload_pdf.
+
+        Args:
+            file_key: S3 object key (path) for the file
+            file_data: Binary file object or raw bytes of the PDF file
+
+        Returns:
+            True if the object was written, False if it already existed
+
+        Raises:
+            ClientError: If S3 operation fails
+        """
+
+        def _put() -> bool:
+            try:
+                self._client().put_object(
+                    Bucket=self.bucket,
+                    Key=file_key,
+                    Body=file_data,
+                    ContentType="application/pdf",
+                    ChecksumAlgorithm="CRC32C",
+                    IfNoneMatch="*",
+                )
+                return True
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") == "PreconditionFailed":
+                    return False
+                raise
+
+        try:
+            created = await asyncio.to_thread(_put)
+        except ClientError as e:
+            raise Exception(f"Failed to upload PDF to S3: {str(e)}") from e
+
+        # Either outcome proves the key exists now
+        if len(_EXISTS_CACHE) >= _EXISTS_CACHE_MAX:
+            _EXISTS_CACHE.pop(next(iter(_EXISTS_CACHE)))
+        _EXISTS_CACHE[file_key] = (time.monotonic() + _EXISTS_CACHE_TTL, True)
+        return created
+
     def check_file_exists(self, file_key: str) -> bool:
         """
         Check if a file exists in S3.
 
+        Repeat checks for the same key within the cache TTL are served
+        from memory instead of a head_object round trip.
+
         Args:
             file_key: S3 object key (path) for the file
 
         Returns:
             True if file exists, False otherwise
         """
+        cached = _EXISTS_CACHE.get(file_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
-            self.s3_client.head_object(Bucket=self.bucket, Key=file_key)
-            return True
-        except ClientError:
-            return False
+            self._client().head_object(Bucket=self.bucket, Key=file_key)
+            exists = True
+        except ClientError as e:
+            # Only a missing key means "does not exist"; credential or
+            # 5xx faults propagate instead of masquerading as absence
+            code = e.response.get("Error", {}).get("Code")
+            if code not in ("404", "NoSuchKey", "NotFound"):
+                raise
+            exists = False
+
+        if len(_EXISTS_CACHE) >= _EXISTS_CACHE_MAX:
+            _EXISTS_CACHE.pop(next(iter(_EXISTS_CACHE)))
+        _EXISTS_CACHE[file_key] = (time.monotonic() + _EXISTS_CACHE_TTL, exists)
+        return exists
+
+    def check_files_exist(self, file_keys: list[str]) -> dict[str, bool]:
+        """
+        Check existence for many keys without one HEAD per key.
+
+        Keys sharing a common prefix resolve through paginated
+        list_objects_v2 calls - one round trip per 1000 keys under the
+        prefix instead of N HEADs. Unrelated keys fall back to HEADs
+        fanned out over a thread pool. Results go through the same TTL
+        cache as check_file_exists.
+
+        Args:
+            file_keys: S3 object keys (paths) to check
+
+        Returns:
+            Mapping of each key to True if it exists, False otherwise
+        """
+        results: dict[str, bool] = {}
+        now = time.monotonic()
+        misses = []
+        for key in file_keys:
+            cached = _EXISTS_CACHE.get(key)
+            if cached is not None and cached[0] > now:
+                results[key] = cached[1]
+            else:
+                misses.append(key)
+        if not misses:
+            return results
+
+        common = os.path.commonprefix(misses)
+        if common:
+            found: set[str] = set()
+            paginator = self._client().get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=common):
+                for obj in page.get("Contents", []):
+                    found.add(obj["Key"])
+            for key in misses:
+                exists = key in found
+                if len(_EXISTS_CACHE) >= _EXISTS_CACHE_MAX:
+                    _EXISTS_CACHE.pop(next(iter(_EXISTS_CACHE)))
+                _EXISTS_CACHE[key] = (now + _EXISTS_CACHE_TTL, exists)
+                results[key] = exists
+        else:
+            # No shared prefix would make the LIST scan the whole
+            # bucket; parallel HEADs (which cache individually) win
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                results.update(zip(misses, pool.map(self.check_file_exists, misses)))
+        return results
 
 
 # Singleton instance
@@ -6,12 +6,18 @@ from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 
+# One transport for the whole session: ASGITransport just wraps the app
+# and is stateless across requests, so rebuilding it per test only adds
+# fixed setup/teardown time. The AsyncClient stays function-scoped (a
+# fresh cookie jar per test) but shares this transport.
+_transport = ASGITransport(app=app)
+
 
 @pytest.fixture
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """Async HTTP client for testing FastAPI endpoints."""
     async with AsyncClient(
-        transport=ASGITransport(app=app),
+        transport=_transport,
         base_url="http://test",
     ) as ac:
         yield ac
@@ -401,6 +401,13 @@ export interface WeeklyAverage {
   total_expenses: number
 }
 
+export interface StatsBundle {
+  summary: TransactionSummary
+  breakdown: TransactionBreakdown
+  trend: TransactionTrendPoint[]
+  weekly_average: WeeklyAverage
+}
+
 // =============================================================================
 // Budget Settings Types
 // =============================================================================
@@ -519,6 +526,9 @@ export const transactionsApi = {
   getWeeklyAverage: () =>
     api.get<WeeklyAverage>('/transactions/stats/weekly-average'),
 
+  getStatsBundle: (days?: number) =>
+    api.get<StatsBundle>(`/transactions/stats/bundle${days ? `?days=${days}` : ''}`),
+
   getWeekSummary: (weekStart?: string) =>
     api.get<WeekSummary>(`/transactions/stats/week-summary${weekStart ? `?week_start=${weekStart}` : ''}`),
 